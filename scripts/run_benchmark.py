@@ -2,12 +2,16 @@
 """Run convergence benchmark between any two models."""
 
 import argparse
-import asyncio
-import json
 from datetime import UTC, datetime
 from pathlib import Path
 
-from convergence.runner import run_benchmark, summarize_results
+import orjson
+
+from convergence.cache import cache_from_env
+from convergence.eventloop import run
+from convergence.runner import model_slug, ndjson_writer, run_benchmark, summarize_results
+from convergence.scheduler import ModelLimits, RateLimitedLLM
+from convergence.session import shared_http_client
 from convergence.wordlist import generate_factorial_pairs
 
 # Default models (versioned aliases)
@@ -37,6 +41,15 @@ async def main() -> None:
     parser.add_argument("--max-rounds", type=int, default=50, help="Max rounds per game")
     parser.add_argument("--seed", type=int, default=42, help="Random seed")
     parser.add_argument("--output-dir", type=Path, default=Path("data/results"), help="Output directory")
+    parser.add_argument(
+        "--temperature", type=float, default=1.0, help="Sampling temperature (0 enables the cache)"
+    )
+    parser.add_argument("--max-concurrency", type=int, default=16, help="In-flight calls per model")
+    parser.add_argument("--rpm", type=float, default=None, help="Requests/minute per model")
+    parser.add_argument("--tpm", type=float, default=None, help="Tokens/minute per model")
+    parser.add_argument(
+        "--pretty", action="store_true", help="Also write an indented .pretty.json copy"
+    )
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
 
     args = parser.parse_args()
@@ -52,21 +65,46 @@ async def main() -> None:
         weighted=True,
     )
 
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    # Computed once so the filename and saved metadata always agree
+    timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+    stem = f"{model_slug(args.model1)}_vs_{model_slug(args.model2)}"
+    output_path = args.output_dir / f"{stem}_{timestamp}.json"
+
     print(f"Model 1: {model1}")
     print(f"Model 2: {model2}")
     print(f"Pairs ({len(seed_pairs)}): {seed_pairs}")
     print("=" * 60)
 
-    results = await run_benchmark(
-        model1=model1,
-        model2=model2,
-        num_games=len(seed_pairs),
-        max_rounds=args.max_rounds,
-        seed_pairs=seed_pairs,
-        verbose=args.verbose,
-    )
-
-    summary = summarize_results(results)
+    # Only used at temperature 0, and only when CONVERGENCE_LLM_CACHE=1
+    cache = cache_from_env()
+
+    try:
+        # Reuse pooled connections for every API call in the run
+        async with shared_http_client():
+            # Stream per-game results as they complete so a crash doesn't lose data
+            with open(output_path.with_suffix(".ndjson"), "wb") as stream:
+                results = await run_benchmark(
+                    model1=model1,
+                    model2=model2,
+                    num_games=len(seed_pairs),
+                    max_rounds=args.max_rounds,
+                    seed_pairs=seed_pairs,
+                    verbose=args.verbose,
+                    scheduler=RateLimitedLLM(
+                        default_limits=ModelLimits(
+                            max_concurrency=args.max_concurrency, rpm=args.rpm, tpm=args.tpm
+                        )
+                    ),
+                    on_result=ndjson_writer(stream),
+                    temperature=args.temperature,
+                    cache=cache,
+                )
+
+        summary = summarize_results(results, cache=cache)
+    finally:
+        if cache is not None:
+            cache.close()
 
     print("\n" + "=" * 60)
     print(f"RESULTS: {args.model1} vs {args.model2}")
@@ -79,32 +117,26 @@ async def main() -> None:
         print("No wins recorded")
 
     # Save results
-    args.output_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-    m1_short = args.model1.replace("/", "_")
-    m2_short = args.model2.replace("/", "_")
-    output_path = args.output_dir / f"{m1_short}_vs_{m2_short}_{timestamp}.json"
-
-    with open(output_path, "w") as f:
-        json.dump(
-            {
-                "metadata": {
-                    "model1": model1,
-                    "model2": model2,
-                    "num_triplets": args.triplets,
-                    "max_rounds": args.max_rounds,
-                    "seed": args.seed,
-                    "timestamp": timestamp,
-                },
-                "results": results,
-                "summary": summary,
-            },
-            f,
-            indent=2,
-        )
+    payload = {
+        "metadata": {
+            "model1": model1,
+            "model2": model2,
+            "num_triplets": args.triplets,
+            "max_rounds": args.max_rounds,
+            "seed": args.seed,
+            "temperature": args.temperature,
+            "timestamp": timestamp,
+        },
+        "results": results,
+        "summary": summary,
+    }
+    output_path.write_bytes(orjson.dumps(payload))
+    if args.pretty:
+        pretty_path = output_path.with_suffix(".pretty.json")
+        pretty_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
 
     print(f"\nSaved to {output_path}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
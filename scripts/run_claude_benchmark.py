@@ -3,10 +3,22 @@
 
 import asyncio
 import json
+from collections.abc import Callable
 from datetime import UTC, datetime
+from itertools import combinations
 from pathlib import Path
+from typing import Any
 
-from convergence.runner import generate_seed_pairs, run_benchmark, summarize_results
+import orjson
+
+from convergence.eventloop import run
+from convergence.runner import (
+    generate_seed_pairs,
+    ndjson_writer,
+    run_benchmark,
+    summarize_results,
+)
+from convergence.scheduler import ModelLimits, RateLimitedLLM
 
 # Claude 4.5 models
 MODELS = [
@@ -20,6 +32,9 @@ NUM_GAMES = 10  # Per model pair
 MAX_ROUNDS = 20
 RANDOM_SEED = 42  # For reproducibility
 
+# Per-model rate limits (adjust to your provider tier)
+MODEL_LIMITS = ModelLimits(max_concurrency=16, rpm=50, tpm=40_000)
+
 
 async def main() -> None:
     """Run the full benchmark."""
@@ -29,73 +44,90 @@ async def main() -> None:
     # Generate fixed seed pairs - SAME pairs used for ALL model combinations
     seed_pairs = generate_seed_pairs(NUM_GAMES, seed=RANDOM_SEED)
 
+    # All model pair combinations: each model against itself, then every cross pair
+    model_pairs = [(model, model) for model in MODELS] + list(combinations(MODELS, 2))
+
     print(f"Generated {len(seed_pairs)} seed pairs with seed={RANDOM_SEED}")
-    print("Same pairs used for all 6 model combinations!")
+    print(f"Same pairs used for all {len(model_pairs)} model combinations!")
     print(f"Pairs: {seed_pairs}")
     print(f"Models: {MODELS}")
     print("=" * 60)
 
     all_results = []
+    pair_summaries: dict[str, dict[str, Any]] = {}
 
-    # All model pair combinations (same + cross)
-    model_pairs = [
-        (MODELS[0], MODELS[0]),  # haiku vs haiku
-        (MODELS[1], MODELS[1]),  # sonnet vs sonnet
-        (MODELS[2], MODELS[2]),  # opus vs opus
-        (MODELS[0], MODELS[1]),  # haiku vs sonnet
-        (MODELS[0], MODELS[2]),  # haiku vs opus
-        (MODELS[1], MODELS[2]),  # sonnet vs opus
-    ]
-
-    for model1, model2 in model_pairs:
-        is_same = model1 == model2
-        benchmark_type = "same_model" if is_same else "cross_model"
-        print(f"\n--- {model1} vs {model2} ---")
+    # One scheduler shared by all pairs so they run concurrently under rate limits
+    scheduler = RateLimitedLLM(default_limits=MODEL_LIMITS)
+
+    timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+    output_path = output_dir / f"claude_4_5_benchmark_{timestamp}.json"
 
-        results = await run_benchmark(
-            model1=model1,
-            model2=model2,
-            num_games=NUM_GAMES,
-            max_rounds=MAX_ROUNDS,
-            seed_pairs=seed_pairs,  # Same pairs for all!
-            verbose=True,
+    # Stream per-game results as they complete so a crash doesn't lose data
+    with open(output_path.with_suffix(".ndjson"), "wb") as stream:
+        write_ndjson = ndjson_writer(stream)
+
+        def result_writer(model1: str, model2: str) -> Callable[[dict[str, Any]], None]:
+            benchmark_type = "same_model" if model1 == model2 else "cross_model"
+
+            def write_result(result: dict[str, Any]) -> None:
+                result["benchmark_type"] = benchmark_type
+                write_ndjson(result)
+                # Pairs run concurrently, so label each line with its pair and game
+                print(
+                    f"[{model1} vs {model2}] Game {result['game_number']}/{NUM_GAMES}: "
+                    f"{result['outcome']} in {result['rounds']} rounds"
+                )
+
+            return write_result
+
+        pair_results = await asyncio.gather(
+            *(
+                run_benchmark(
+                    model1=model1,
+                    model2=model2,
+                    num_games=NUM_GAMES,
+                    max_rounds=MAX_ROUNDS,
+                    seed_pairs=seed_pairs,  # Same pairs for all!
+                    scheduler=scheduler,
+                    on_result=result_writer(model1, model2),
+                )
+                for model1, model2 in model_pairs
+            )
         )
 
-        for r in results:
-            r["benchmark_type"] = benchmark_type
+    for (model1, model2), results in zip(model_pairs, pair_results, strict=True):
+        print(f"\n--- {model1} vs {model2} ---")
         all_results.extend(results)
 
         summary = summarize_results(results)
+        pair_summaries[f"{model1}_vs_{model2}"] = summary
         print(f"\nSummary: {json.dumps(summary, indent=2)}")
 
+    overall = summarize_results(all_results)
+
     # Save all results
-    timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-    output_path = output_dir / f"claude_4_5_benchmark_{timestamp}.json"
-    with open(output_path, "w") as f:
-        json.dump(
-            {
-                "metadata": {
-                    "models": MODELS,
-                    "num_games_per_pair": NUM_GAMES,
-                    "max_rounds": MAX_ROUNDS,
-                    "random_seed": RANDOM_SEED,
-                    "timestamp": timestamp,
-                },
-                "results": all_results,
-                "summary": {
-                    "total_games": len(all_results),
-                    "overall": summarize_results(all_results),
-                },
-            },
-            f,
-            indent=2,
-        )
+    payload = {
+        "metadata": {
+            "models": MODELS,
+            "num_games_per_pair": NUM_GAMES,
+            "max_rounds": MAX_ROUNDS,
+            "random_seed": RANDOM_SEED,
+            "timestamp": timestamp,
+        },
+        "results": all_results,
+        "summary": {
+            "total_games": len(all_results),
+            "overall": overall,
+            "by_pair": pair_summaries,
+        },
+    }
+    output_path.write_bytes(orjson.dumps(payload))
 
     print("\n" + "=" * 60)
     print(f"Results saved to {output_path}")
     print(f"Total games: {len(all_results)}")
-    print(f"Overall summary: {json.dumps(summarize_results(all_results), indent=2)}")
+    print(f"Overall summary: {json.dumps(overall, indent=2)}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
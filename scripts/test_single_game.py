@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 """Test script to run a single game and verify data looks correct."""
 
-import asyncio
 import json
 from pathlib import Path
 
+from convergence.eventloop import run
 from convergence.runner import run_benchmark, summarize_results
 
 
@@ -36,4 +36,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,7 +1,11 @@
 """Convergence Benchmark - LLM word association game evaluation."""
 
+from typing import TYPE_CHECKING, Any
+
 from convergence.game import Game, GameResult, GameState, Outcome
-from convergence.wordlist import COMMON_NOUNS, get_seed_words
+
+if TYPE_CHECKING:
+    from convergence.wordlist import COMMON_NOUNS, COMMON_NOUNS_SET, get_seed_words
 
 __all__ = [
     "Game",
@@ -9,6 +13,18 @@ __all__ = [
     "GameState",
     "Outcome",
     "COMMON_NOUNS",
+    "COMMON_NOUNS_SET",
     "get_seed_words",
 ]
 __version__ = "0.1.0"
+
+# Word lists are large; only load them when first accessed (PEP 562)
+_LAZY_WORDLIST = {"COMMON_NOUNS", "COMMON_NOUNS_SET", "get_seed_words"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_WORDLIST:
+        from convergence import wordlist
+
+        return getattr(wordlist, name)
+    raise AttributeError(f"module 'convergence' has no attribute {name!r}")
@@ -0,0 +1,88 @@
+"""On-disk cache of LLM word choices for fast benchmark re-runs.
+
+Seed pairs are generated from a fixed random seed, so re-running a
+benchmark sends many byte-identical prompts. Caching the extracted word
+per (model, temperature, prompt) skips those API calls entirely.
+
+Players only consult the cache at temperature 0, and only on a round's first
+attempt: a retry after a repeated word resends the same prompt to get a
+different answer, so replaying the cached word would just repeat it.
+
+Entry points open the cache with cache_from_env(), enabled by the
+``CONVERGENCE_LLM_CACHE=1`` environment variable, pass it to run_benchmark
+and close it when the run ends.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+DEFAULT_CACHE_PATH = Path("data/llm_cache.sqlite")
+CACHE_ENV_VAR = "CONVERGENCE_LLM_CACHE"
+
+
+class LLMCache:
+    """SQLite-backed mapping from request key to the word the LLM chose.
+
+    Attributes:
+        hits: Lookups answered from the cache since it was opened.
+        misses: Lookups that found no entry.
+    """
+
+    def __init__(self, path: Path | str = DEFAULT_CACHE_PATH) -> None:
+        self.hits = 0
+        self.misses = 0
+        path = Path(path)
+        if str(path) != ":memory:":
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS words (key TEXT PRIMARY KEY, word TEXT)")
+        self._conn.commit()
+
+    @staticmethod
+    def key(model: str, temperature: float, prompt: str) -> str:
+        """Compute the cache key for a request.
+
+        Args:
+            model: LiteLLM model identifier.
+            temperature: Sampling temperature.
+            prompt: Full user prompt.
+
+        Returns:
+            Hex digest identifying the request.
+        """
+        data = json.dumps(
+            {"model": model, "temperature": temperature, "prompt": prompt}, sort_keys=True
+        )
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached word for a key, or None on a miss."""
+        row = self._conn.execute("SELECT word FROM words WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def set(self, key: str, word: str) -> None:
+        """Store the word chosen for a key."""
+        self._conn.execute("INSERT OR REPLACE INTO words (key, word) VALUES (?, ?)", (key, word))
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+def cache_from_env() -> LLMCache | None:
+    """Open the default cache if ``CONVERGENCE_LLM_CACHE=1`` is set.
+
+    Returns:
+        An LLMCache at DEFAULT_CACHE_PATH, or None when caching is disabled.
+    """
+    if os.environ.get(CACHE_ENV_VAR) == "1":
+        return LLMCache()
+    return None
@@ -0,0 +1,44 @@
+"""Event loop selection for benchmark entry points.
+
+Benchmarks spend most of their time scheduling tasks and waiting on HTTP
+sockets, which libuv-based loops handle faster than asyncio's default
+selector loop. Install them with ``pip install convergence[fast]``
+(uvloop on POSIX, winloop on Windows); without them the default loop is used.
+"""
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+
+def fast_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return a factory for the fastest installed event loop.
+
+    Returns:
+        ``uvloop.new_event_loop`` or ``winloop.new_event_loop`` if available,
+        otherwise None (asyncio's default loop).
+    """
+    try:
+        import uvloop  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        pass
+    else:
+        return uvloop.new_event_loop  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
+
+    try:
+        import winloop  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return None
+    return winloop.new_event_loop  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
+
+
+def run[T](main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on the fastest available event loop.
+
+    Args:
+        main: Top-level coroutine, e.g. a script's ``main()``.
+
+    Returns:
+        The coroutine's result.
+    """
+    return asyncio.run(main, loop_factory=fast_loop_factory())
@@ -1,5 +1,6 @@
 """Core game logic for the Convergence word association game."""
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -14,7 +15,7 @@ class Outcome(Enum):
     INVALID_WORD = "invalid_word"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameState:
     """Immutable state of a Convergence game.
 
@@ -24,6 +25,7 @@ class GameState:
         player2_words: Words chosen by player 2.
         seed_word1: Starting word assigned to player 1.
         seed_word2: Starting word assigned to player 2.
+        finished: Whether both players said the same word in the last round.
     """
 
     round: int = 0
@@ -31,6 +33,17 @@ class GameState:
     player2_words: tuple[str, ...] = field(default_factory=tuple)
     seed_word1: str | None = None
     seed_word2: str | None = None
+    finished: bool = field(init=False, compare=False)
+    # Lazily built set of used words, carried forward incrementally by add_round
+    _all_words: frozenset[str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        finished = (
+            bool(self.player1_words)
+            and bool(self.player2_words)
+            and self.player1_words[-1] == self.player2_words[-1]
+        )
+        object.__setattr__(self, "finished", finished)
 
     def add_round(self, word1: str, word2: str) -> "GameState":
         """Add a round with words from both players.
@@ -42,40 +55,47 @@ class GameState:
         Returns:
             New GameState with the round added.
         """
-        return GameState(
+        # Normalize once and intern so later comparisons and set lookups are cheap
+        word1 = sys.intern(word1.lower().strip())
+        word2 = sys.intern(word2.lower().strip())
+        state = GameState(
             round=self.round + 1,
-            player1_words=(*self.player1_words, word1.lower().strip()),
-            player2_words=(*self.player2_words, word2.lower().strip()),
+            player1_words=self.player1_words + (word1,),
+            player2_words=self.player2_words + (word2,),
             seed_word1=self.seed_word1,
             seed_word2=self.seed_word2,
         )
+        object.__setattr__(state, "_all_words", self.all_words | {word1, word2})
+        return state
 
     @property
     def is_finished(self) -> bool:
         """Check if the game has finished (players said the same word)."""
-        if not self.player1_words or not self.player2_words:
-            return False
-        return self.player1_words[-1] == self.player2_words[-1]
+        return self.finished
 
     @property
     def converged_word(self) -> str | None:
         """Get the word both players converged on, if any."""
-        if self.is_finished and self.player1_words:
+        if self.finished:
             return self.player1_words[-1]
         return None
 
     @property
-    def all_words(self) -> set[str]:
+    def all_words(self) -> frozenset[str]:
         """Get all words used by both players, including seed words."""
-        words = set(self.player1_words) | set(self.player2_words)
-        if self.seed_word1:
-            words.add(self.seed_word1)
-        if self.seed_word2:
-            words.add(self.seed_word2)
-        return words
-
-
-@dataclass
+        all_words = self._all_words
+        if all_words is None:
+            words = set(self.player1_words) | set(self.player2_words)
+            if self.seed_word1:
+                words.add(self.seed_word1)
+            if self.seed_word2:
+                words.add(self.seed_word2)
+            all_words = frozenset(words)
+            object.__setattr__(self, "_all_words", all_words)
+        return all_words
+
+
+@dataclass(frozen=True, slots=True)
 class GameResult:
     """Result of a completed Convergence game.
 
@@ -113,7 +133,7 @@ class GameResult:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Game:
     """Orchestrates a Convergence game between two players.
 
@@ -1,11 +1,30 @@
 """LLM player abstraction using litellm."""
 
+import asyncio
 import re
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 
 from litellm import acompletion  # pyright: ignore[reportUnknownVariableType]
 
+from convergence.cache import LLMCache
 from convergence.game import GameState
+from convergence.scheduler import RateLimitedLLM
+
+# Punctuation and quotes stripped from responses
+_STRIP_RE = re.compile(r"""["'.!?,;:()]""")
+# First whitespace-delimited token that is not all punctuation
+_TOKEN_RE = re.compile(r"""\S*[^\s"'.!?,;:()]\S*""")
+
+# Final line of every prompt; everything before it is a stable, cacheable prefix
+_REPLY_INSTRUCTION = "Reply with a single word, nothing else."
+
+# Start of each round block in a prompt, where the cacheable prefix is split
+_ROUND_START_RE = re.compile(r"^(?=Round \d+:$)", re.MULTILINE)
+
+# Histories kept per player; roughly one entry per game in flight
+_HISTORY_CACHE_SIZE = 256
+
 
 def extract_word(response: str) -> str | None:
     """Extract a single word from an LLM response.
@@ -16,31 +35,88 @@ def extract_word(response: str) -> str | None:
     Returns:
         Cleaned word in lowercase, or None if no valid word found.
     """
-    if not response or not response.strip():
+    # Take first word if multiple, scanning only as far as that word
+    match = _TOKEN_RE.search(response)
+    if match is None:
         return None
 
     # Remove common punctuation and quotes
-    cleaned = re.sub(r'["\'.!?,;:()]', "", response.strip())
-
-    # Take first word if multiple
-    words = cleaned.split()
-    if not words:
-        return None
-
-    return words[0].lower()
+    return sys.intern(_STRIP_RE.sub("", match.group()).lower())
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """An LLM player in the Convergence game.
 
     Attributes:
         model: LiteLLM model identifier (e.g., "gemini/gemini-2.5-flash").
         temperature: Sampling temperature for responses.
+        scheduler: Shared rate-limited scheduler for API calls. If None,
+            calls go straight to litellm.
+        cache: Optional on-disk cache of previous answers, used only when
+            temperature is 0. The caller owns it and closes it when done.
+        prompt_caching: Mark the instructions and history as a cacheable
+            prefix for Anthropic models. The prompt text is unchanged, but is
+            sent as one block per round so each round extends the previous
+            round's cached prefix. Anthropic only caches prefixes above ~1024
+            tokens, so this helps long games most.
     """
 
     model: str
     temperature: float = 1.0
+    scheduler: RateLimitedLLM | None = None
+    cache: LLMCache | None = field(default=None, repr=False)
+    prompt_caching: bool = False
+    _history_cache: dict[tuple[bool, tuple[str, ...], tuple[str, ...]], str] = field(
+        default_factory=lambda: {}, init=False, repr=False, compare=False
+    )
+    _base_kwargs: dict[str, object] = field(
+        default_factory=lambda: {}, init=False, repr=False, compare=False
+    )
+    _inflight: dict[str, asyncio.Future[str | None]] = field(
+        default_factory=lambda: {}, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Request settings are fixed per player, so build them once
+        self._base_kwargs = {
+            "model": self.model,
+            "temperature": self.temperature,
+            "max_tokens": 50,
+        }
+        # GPT-5 models need reasoning_effort to avoid empty responses
+        if "gpt-5" in self.model:
+            self._base_kwargs["reasoning_effort"] = "minimal"
+
+    def _history(
+        self, is_player1: bool, my_words: tuple[str, ...], opponent_words: tuple[str, ...]
+    ) -> str:
+        """Render the round history, extending the previous round's text when cached.
+
+        Games only ever append one round at a time, so the history for a state
+        is the history for its parent plus one block. Caching by the full word
+        history keeps this correct when several games share a player.
+        """
+        key = (is_player1, my_words, opponent_words)
+        history = self._history_cache.get(key)
+        if history is not None:
+            return history
+
+        n = len(my_words)
+        parent = self._history_cache.pop((is_player1, my_words[:-1], opponent_words[:-1]), None)
+        if parent is not None and n == len(opponent_words):
+            block = f"Round {n}:\nYou: {my_words[-1]}\nOther: {opponent_words[-1]}\n"
+            history = f"{parent}\n{block}" if parent else block
+        else:
+            history = "\n".join(
+                f"Round {i + 1}:\nYou: {my_word}\nOther: {opp_word}\n"
+                for i, (my_word, opp_word) in enumerate(zip(my_words, opponent_words, strict=False))
+            )
+
+        if len(self._history_cache) >= _HISTORY_CACHE_SIZE:
+            del self._history_cache[next(iter(self._history_cache))]
+        self._history_cache[key] = history
+        return history
 
     def build_prompt(self, state: GameState, is_player1: bool) -> str:
         """Build the user prompt for the current game state.
@@ -53,61 +129,112 @@ class Player:
             User prompt string.
         """
         if is_player1:
-            my_words = list(state.player1_words)
-            opponent_words = list(state.player2_words)
+            my_words = state.player1_words
+            opponent_words = state.player2_words
         else:
-            my_words = list(state.player2_words)
-            opponent_words = list(state.player1_words)
+            my_words = state.player2_words
+            opponent_words = state.player1_words
 
         # Add seed words as round 0
         if state.seed_word1 and state.seed_word2:
             my_seed = state.seed_word1 if is_player1 else state.seed_word2
             opp_seed = state.seed_word2 if is_player1 else state.seed_word1
-            my_words = [my_seed] + my_words
-            opponent_words = [opp_seed] + opponent_words
-
-        current_round = len(my_words)
-
-        # Build history
-        history_lines = []
-        for i, (my_word, opp_word) in enumerate(zip(my_words, opponent_words)):
-            history_lines.append(f"Round {i + 1}:")
-            history_lines.append(f"You: {my_word}")
-            history_lines.append(f"Other: {opp_word}")
-            history_lines.append("")
+            my_words = (my_seed, *my_words)
+            opponent_words = (opp_seed, *opponent_words)
 
-        history = "\n".join(history_lines)
+        history = self._history(is_player1, my_words, opponent_words)
 
         prompt = f"""You're playing Convergence - the goal is to say the same word as the other player. Don't repeat any word from the history.
 
 {history}
-Reply with a single word, nothing else."""
+{_REPLY_INSTRUCTION}"""
 
         return prompt
 
-    async def get_word(self, state: GameState, is_player1: bool) -> str | None:
+    def _user_message(self, prompt: str) -> dict[str, object]:
+        """Wrap a prompt as a user message, marking its cacheable prefix if enabled.
+
+        Anthropic only reuses a cached prefix that ends on a block boundary, so
+        the instructions and each round go in their own text blocks, with the
+        cache breakpoint on the latest round. Next round's prompt then starts
+        with exactly these blocks.
+        """
+        if not (self.prompt_caching and ("anthropic" in self.model or "claude" in self.model)):
+            return {"role": "user", "content": prompt}
+        prefix = prompt.removesuffix(_REPLY_INSTRUCTION)
+        blocks: list[dict[str, object]] = [
+            {"type": "text", "text": text} for text in _ROUND_START_RE.split(prefix) if text
+        ]
+        blocks[-1]["cache_control"] = {"type": "ephemeral"}
+        blocks.append({"type": "text", "text": _REPLY_INSTRUCTION})
+        return {"role": "user", "content": blocks}
+
+    async def get_word(self, state: GameState, is_player1: bool, attempt: int = 0) -> str | None:
         """Get a word choice from the LLM.
 
         Args:
             state: Current game state.
             is_player1: Whether this player is player 1.
+            attempt: 0-based retry index for this round. Retries resend the
+                same prompt to get a different answer, so only the first
+                attempt may be answered from the cache or a shared request.
 
         Returns:
             The word chosen by the LLM, or None if invalid.
         """
         prompt = self.build_prompt(state, is_player1)
+        # Sampled answers and retries must stay independent, so only first
+        # deterministic attempts are shared
+        if self.temperature != 0 or attempt > 0:
+            return await self._request_word(prompt)
+
+        key = LLMCache.key(self.model, self.temperature, prompt)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return sys.intern(cached)
+
+        # Coalesce concurrent identical requests into one upstream call
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request_word(prompt, key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish_inflight(key, t))
+        # Shield so one cancelled caller does not cancel the call for the others
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, key: str, task: asyncio.Future[str | None]) -> None:
+        """Forget a finished shared request, consuming any error it raised.
+
+        Every waiter already received the error; retrieving it here keeps a
+        request whose callers were all cancelled from logging it as unhandled.
+        """
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()
 
-        # Build kwargs - GPT-5 models need reasoning_effort to avoid empty responses
-        kwargs: dict[str, object] = {
-            "model": self.model,
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": self.temperature,
-            "max_tokens": 50,
-        }
-        if "gpt-5" in self.model:
-            kwargs["reasoning_effort"] = "minimal"
+    async def aclose(self) -> None:
+        """Cancel shared requests still running after their games ended.
 
-        response = await acompletion(**kwargs)  # pyright: ignore[reportArgumentType]
+        A shared request keeps running when the game awaiting it is cancelled
+        so other games can use it; once no games remain, cancel the leftovers.
+        """
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _request_word(self, prompt: str, cache_key: str | None = None) -> str | None:
+        """Ask the LLM for a word, storing it under cache_key if a cache is set."""
+        kwargs = {**self._base_kwargs, "messages": [self._user_message(prompt)]}
+
+        if self.scheduler is not None:
+            response = await self.scheduler.acompletion(**kwargs)
+        else:
+            response = await acompletion(**kwargs)  # pyright: ignore[reportArgumentType]
 
         content = response.choices[0].message.content  # pyright: ignore[reportUnknownMemberType,reportAttributeAccessIssue,reportUnknownVariableType]
-        return extract_word(content) if content else None  # pyright: ignore[reportUnknownArgumentType]
+        word = extract_word(content) if content else None  # pyright: ignore[reportUnknownArgumentType]
+        if self.cache is not None and cache_key is not None and word is not None:
+            self.cache.set(cache_key, word)
+        return word
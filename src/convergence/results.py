@@ -0,0 +1,55 @@
+"""Column-oriented storage of game results for fast summaries."""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from convergence.game import Outcome
+
+
+@dataclass(frozen=True, slots=True)
+class ResultsBuffer:
+    """Outcome and round columns of a set of game results.
+
+    Summaries only need these two fields, so keeping them as contiguous
+    arrays lets them be computed with vectorized NumPy operations instead
+    of a dictionary lookup per game.
+
+    Attributes:
+        outcomes: Outcome value of each game (e.g., "win").
+        rounds: Number of rounds played in each game.
+    """
+
+    outcomes: npt.NDArray[np.str_]
+    rounds: npt.NDArray[np.int32]
+
+    @classmethod
+    def from_results(cls, results: Iterable[Mapping[str, Any]]) -> "ResultsBuffer":
+        """Build a buffer from game result dictionaries.
+
+        Args:
+            results: Game results as produced by GameResult.to_dict().
+
+        Returns:
+            ResultsBuffer holding the outcome and rounds columns.
+        """
+        outcomes: list[str] = []
+        rounds: list[int] = []
+        for r in results:
+            outcomes.append(r["outcome"])
+            rounds.append(r["rounds"])
+        return cls(np.array(outcomes, dtype="U16"), np.array(rounds, dtype=np.int32))
+
+    def __len__(self) -> int:
+        return len(self.outcomes)
+
+    def count(self, outcome: Outcome) -> int:
+        """Count the games that ended with the given outcome."""
+        return int(np.count_nonzero(self.outcomes == outcome.value))
+
+    def rounds_for(self, outcome: Outcome) -> npt.NDArray[np.int32]:
+        """Return the round counts of games that ended with the given outcome."""
+        return self.rounds[self.outcomes == outcome.value]
@@ -1,16 +1,43 @@
 """Game runner for executing Convergence games between LLMs."""
 
 import asyncio
-import json
+from collections.abc import Callable, Coroutine, Iterator, Sequence
+from contextlib import ExitStack
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
+import orjson
+
+from convergence.cache import LLMCache
 from convergence.game import GameResult, GameState, Outcome
 from convergence.player import Player
+from convergence.results import ResultsBuffer
+from convergence.scheduler import RateLimitedLLM
+from convergence.session import ensure_shared_http_client
 from convergence.wordlist import get_seed_words
 
+_PATH_TRANS = str.maketrans("/", "_")
+
+# Starting words for player 1 and player 2, or (None, None) to start unseeded
+SeedPair = tuple[str, str] | tuple[None, None]
+
+# Placeholder for a word that was not awaited because the round was already decided
+_SKIPPED = ""
+
+
+def model_slug(model: str) -> str:
+    """Make a model identifier safe for use in a filename.
+
+    Args:
+        model: LiteLLM model identifier (e.g., "anthropic/claude-haiku-4-5").
+
+    Returns:
+        The identifier with path separators replaced by underscores.
+    """
+    return model.translate(_PATH_TRANS)
+
 
 @dataclass
 class GameRunner:
@@ -30,29 +57,72 @@ class GameRunner:
 
     max_retries_per_round: int = 50  # High limit - models must comply
 
+    async def _request_words(self, state: GameState, attempt: int) -> tuple[str | None, str | None]:
+        """Ask both players for their next word concurrently.
+
+        If the first word to arrive is invalid, the game is lost whatever the
+        other player says, so the slower request is cancelled and its word
+        comes back as ``_SKIPPED``. A repeated word still waits for the other
+        player, whose answer may be invalid, so the outcome does not depend on
+        which call returns first.
+
+        Args:
+            state: Current game state.
+            attempt: 0-based retry index for this round.
+
+        Returns:
+            Words from player 1 and player 2.
+        """
+        task1 = asyncio.create_task(self.player1.get_word(state, True, attempt))
+        task2 = asyncio.create_task(self.player2.get_word(state, False, attempt))
+        try:
+            done, _ = await asyncio.wait((task1, task2), return_when=asyncio.FIRST_COMPLETED)
+            if len(done) == 1:
+                first = done.pop()
+                word = first.result()
+                if word is None:
+                    if first is task1:
+                        return word, _SKIPPED
+                    return _SKIPPED, word
+            return await task1, await task2
+        finally:
+            for task in (task1, task2):
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(task1, task2, return_exceptions=True)
+
     async def play_game(
-        self, seed_word1: str | None = None, seed_word2: str | None = None
+        self,
+        seed_word1: str | None = None,
+        seed_word2: str | None = None,
+        game_number: int | None = None,
     ) -> GameResult:
         """Play a single game between the two players.
 
         Args:
             seed_word1: Optional starting word for player 1.
             seed_word2: Optional starting word for player 2.
+            game_number: Optional game index used to label progress lines, so
+                games played concurrently can be told apart.
 
         Returns:
             GameResult with the outcome and full history.
         """
         state = GameState(seed_word1=seed_word1, seed_word2=seed_word2)
         total_retries = 0
+        # Bind loop-invariant attributes once rather than per round
+        request_words = self._request_words
+        model1 = self.player1.model
+        model2 = self.player2.model
+        verbose = self.verbose
+        label = f"[Game {game_number}] " if game_number is not None else ""
+        max_retries = self.max_retries_per_round
 
         for round_num in range(self.max_rounds):
             # Retry loop for rule violations (repeated words)
-            for retry in range(self.max_retries_per_round):
+            for retry in range(max_retries):
                 # Get words from both players concurrently
-                word1_task = self.player1.get_word(state, is_player1=True)
-                word2_task = self.player2.get_word(state, is_player1=False)
-
-                word1, word2 = await asyncio.gather(word1_task, word2_task)
+                word1, word2 = await request_words(state, retry)
 
                 # Check for invalid words
                 if word1 is None or word2 is None:
@@ -61,23 +131,24 @@ class GameRunner:
                         rounds=round_num + 1,
                         converged_word=None,
                         state=state,
-                        player1_model=self.player1.model,
-                        player2_model=self.player2.model,
+                        player1_model=model1,
+                        player2_model=model2,
                     )
 
                 # Check for repetition - if either word was used before, retry
-                word1_repeated = word1 in state.all_words
-                word2_repeated = word2 in state.all_words
+                seen = state.all_words
+                word1_repeated = word1 in seen
+                word2_repeated = word2 in seen
 
                 if word1_repeated or word2_repeated:
                     total_retries += 1
-                    if self.verbose:
+                    if verbose:
                         repeated = []
                         if word1_repeated:
                             repeated.append(f"P1:'{word1}'")
                         if word2_repeated:
                             repeated.append(f"P2:'{word2}'")
-                        print(f"Round {round_num + 1} retry {retry + 1}: {', '.join(repeated)} repeated, re-running...")
+                        print(f"{label}Round {round_num + 1} retry {retry + 1}: {', '.join(repeated)} repeated, re-running...")
                     continue  # Retry this round
 
                 # Valid words - break out of retry loop
@@ -89,27 +160,27 @@ class GameRunner:
                     rounds=round_num + 1,
                     converged_word=None,
                     state=state,
-                    player1_model=self.player1.model,
-                    player2_model=self.player2.model,
+                    player1_model=model1,
+                    player2_model=model2,
                 )
 
-            if self.verbose:
-                print(f"Round {round_num + 1}: '{word1}' vs '{word2}'")
+            if verbose:
+                print(f"{label}Round {round_num + 1}: '{word1}' vs '{word2}'")
 
             # Add the round
             state = state.add_round(word1, word2)
 
             # Check for convergence
-            if state.is_finished:
-                if self.verbose:
-                    print(f"Converged on '{state.converged_word}'! (total retries: {total_retries})")
+            if state.finished:
+                if verbose:
+                    print(f"{label}Converged on '{state.converged_word}'! (total retries: {total_retries})")
                 return GameResult(
                     outcome=Outcome.WIN,
                     rounds=round_num + 1,
                     converged_word=state.converged_word,
                     state=state,
-                    player1_model=self.player1.model,
-                    player2_model=self.player2.model,
+                    player1_model=model1,
+                    player2_model=model2,
                 )
 
         # Reached max rounds without convergence
@@ -118,8 +189,8 @@ class GameRunner:
             rounds=self.max_rounds,
             converged_word=None,
             state=state,
-            player1_model=self.player1.model,
-            player2_model=self.player2.model,
+            player1_model=model1,
+            player2_model=model2,
         )
 
 
@@ -140,6 +211,71 @@ def generate_seed_pairs(num_pairs: int, seed: int | None = None) -> list[tuple[s
     return [get_seed_words() for _ in range(num_pairs)]
 
 
+async def play_one_game(
+    runner: GameRunner, seed_pair: SeedPair, game_number: int
+) -> dict[str, Any]:
+    """Play one game and return its result with benchmark metadata attached.
+
+    Args:
+        runner: Runner holding the two players.
+        seed_pair: Starting words for player 1 and player 2, or
+            (None, None) for an unseeded game.
+        game_number: 1-based index of the game within the benchmark.
+
+    Returns:
+        Game result dictionary including game_number and timestamp.
+    """
+    result = await runner.play_game(*seed_pair, game_number=game_number)
+    result_dict = result.to_dict()
+    result_dict["game_number"] = game_number
+    result_dict["timestamp"] = datetime.now(UTC).isoformat()
+    return result_dict
+
+
+async def _bounded_runner(
+    play: Callable[[int, SeedPair], Coroutine[Any, Any, dict[str, Any]]],
+    seed_pairs: Sequence[SeedPair],
+    max_in_flight: int,
+) -> list[dict[str, Any]]:
+    """Play games through a sliding window of at most ``max_in_flight`` tasks.
+
+    A new game starts as soon as any running game finishes, so the window stays
+    full without ever creating a task per game up front. If a game raises, the
+    remaining games are cancelled and the exception propagates.
+
+    Args:
+        play: Coroutine function taking (game_number, seed_pair).
+        seed_pairs: Seed pairs to play, one game each.
+        max_in_flight: Maximum number of games running at once.
+
+    Returns:
+        Game results in game order.
+    """
+    results: list[dict[str, Any]] = [{} for _ in seed_pairs]
+    pending: dict[asyncio.Task[dict[str, Any]], int] = {}
+    next_index = 0
+
+    def fill() -> None:
+        nonlocal next_index
+        while next_index < len(seed_pairs) and len(pending) < max_in_flight:
+            task = asyncio.create_task(play(next_index + 1, seed_pairs[next_index]))
+            pending[task] = next_index
+            next_index += 1
+
+    fill()
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                results[pending.pop(task)] = task.result()
+            fill()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    return results
+
+
 async def run_benchmark(
     model1: str,
     model2: str,
@@ -148,86 +284,205 @@ async def run_benchmark(
     output_dir: Path | None = None,
     verbose: bool = False,
     seed_pairs: list[tuple[str, str]] | None = None,
+    scheduler: RateLimitedLLM | None = None,
+    on_result: Callable[[dict[str, Any]], None] | None = None,
+    prompt_caching: bool = False,
+    max_in_flight: int = 16,
+    temperature: float = 1.0,
+    cache: LLMCache | None = None,
+    use_seed_words: bool = True,
 ) -> list[dict[str, Any]]:
     """Run a benchmark of multiple games between two models.
 
+    Up to ``max_in_flight`` games run at once, with the next game starting as
+    soon as one finishes; results are returned in game order. Calls to
+    OpenAI-family providers share one keep-alive HTTP client, reusing the
+    caller's if one is installed.
+
     Args:
         model1: LiteLLM model identifier for player 1.
         model2: LiteLLM model identifier for player 2.
         num_games: Number of games to play.
         max_rounds: Maximum rounds per game.
-        output_dir: Directory to save results (optional).
+        output_dir: Directory to stream results to as NDJSON, one line per
+            game in completion order (optional).
         verbose: Whether to print progress.
         seed_pairs: Pre-generated seed word pairs for reproducibility.
             If None, generates random pairs. Use generate_seed_pairs()
             to create the same pairs for all models.
+        scheduler: Shared rate-limited scheduler for API calls. Pass the
+            same instance to concurrent benchmarks to throttle them jointly.
+        on_result: Callback invoked with each game's result dictionary as
+            soon as the game finishes, e.g. to stream results to disk.
+        prompt_caching: Mark prompt prefixes as cacheable for Anthropic models.
+        max_in_flight: Maximum number of games in progress at once.
+        temperature: Sampling temperature for both players.
+        cache: Answer cache shared by both players, consulted only at
+            temperature 0. The caller owns it and closes it when done;
+            see cache_from_env().
+        use_seed_words: Start each game from random seed words when
+            seed_pairs is not given. If False, games start unseeded.
 
     Returns:
         List of game results as dictionaries.
     """
-    player1 = Player(model=model1)
-    player2 = Player(model=model2)
+    run_timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+    player1 = Player(
+        model=model1,
+        temperature=temperature,
+        scheduler=scheduler,
+        cache=cache,
+        prompt_caching=prompt_caching,
+    )
+    player2 = Player(
+        model=model2,
+        temperature=temperature,
+        scheduler=scheduler,
+        cache=cache,
+        prompt_caching=prompt_caching,
+    )
     runner = GameRunner(player1, player2, max_rounds=max_rounds, verbose=verbose)
 
     # Use provided pairs or generate new ones
-    if seed_pairs is None:
-        seed_pairs = [get_seed_words() for _ in range(num_games)]
-    elif len(seed_pairs) < num_games:
-        raise ValueError(f"Need {num_games} seed pairs, got {len(seed_pairs)}")
+    pairs: list[SeedPair]
+    if seed_pairs is not None:
+        if len(seed_pairs) < num_games:
+            raise ValueError(f"Need {num_games} seed pairs, got {len(seed_pairs)}")
+        pairs = list(seed_pairs[:num_games])
+    elif use_seed_words:
+        pairs = [get_seed_words() for _ in range(num_games)]
+    else:
+        pairs = [(None, None)] * num_games
+
+    output_path: Path | None = None
+    if output_dir:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        filename = f"{model_slug(model1)}_vs_{model_slug(model2)}_{run_timestamp}.ndjson"
+        output_path = output_dir / filename
 
-    results: list[dict[str, Any]] = []
+    with ExitStack() as stack:
+        # Stream each result to disk as it completes so a crash keeps finished games
+        stream = stack.enter_context(open(output_path, "wb")) if output_path else None
 
-    for i in range(num_games):
-        seed_word1, seed_word2 = seed_pairs[i]
+        write_result = ndjson_writer(stream) if stream is not None else None
 
-        if verbose:
-            print(f"\n=== Game {i + 1}/{num_games} ===")
-            print(f"Seed words: '{seed_word1}' vs '{seed_word2}'")
+        async def play(game_number: int, seed_pair: SeedPair) -> dict[str, Any]:
+            # Games run concurrently, so every progress line names its game
+            if verbose and seed_pair[0] is not None:
+                print(f"[Game {game_number}] Seed words: '{seed_pair[0]}' vs '{seed_pair[1]}'")
 
-        result = await runner.play_game(seed_word1, seed_word2)
-        result_dict = result.to_dict()
-        result_dict["game_number"] = i + 1
-        result_dict["timestamp"] = datetime.now(UTC).isoformat()
-        results.append(result_dict)
+            result_dict = await play_one_game(runner, seed_pair, game_number)
 
-        if verbose:
-            print(f"Outcome: {result.outcome.value}, Rounds: {result.rounds}")
+            if write_result is not None:
+                write_result(result_dict)
+            if on_result is not None:
+                on_result(result_dict)
 
-    # Save results if output directory specified
-    if output_dir:
-        output_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-        filename = f"{model1.replace('/', '_')}_vs_{model2.replace('/', '_')}_{timestamp}.json"
-        output_path = output_dir / filename
-        with open(output_path, "w") as f:
-            json.dump(results, f, indent=2)
-        if verbose:
-            print(f"\nResults saved to {output_path}")
+            if verbose:
+                print(
+                    f"[Game {game_number}] Outcome: {result_dict['outcome']}, "
+                    f"Rounds: {result_dict['rounds']}"
+                )
+            return result_dict
+
+        # Games are independent, so play them concurrently over pooled connections
+        async with ensure_shared_http_client():
+            try:
+                results = await _bounded_runner(play, pairs, max_in_flight)
+            finally:
+                await player1.aclose()
+                await player2.aclose()
+
+    if output_path and verbose:
+        print(f"\nResults saved to {output_path}")
 
     return results
 
 
-def summarize_results(results: list[dict[str, Any]]) -> dict[str, Any]:
+def ndjson_writer(stream: IO[bytes]) -> Callable[[dict[str, Any]], None]:
+    """Make a callback that appends each game result to an NDJSON stream.
+
+    Every line is flushed as soon as it is written, so a crash keeps the games
+    that already finished. The result suits run_benchmark's on_result.
+
+    Args:
+        stream: Binary file opened for writing.
+
+    Returns:
+        Function writing one result dictionary per line.
+    """
+
+    def write(result: dict[str, Any]) -> None:
+        stream.write(orjson.dumps(result))
+        stream.write(b"\n")
+        stream.flush()
+
+    return write
+
+
+def read_ndjson(path: Path) -> Iterator[dict[str, Any]]:
+    """Lazily read game results streamed to an NDJSON file.
+
+    Args:
+        path: File written by run_benchmark, one result per line.
+
+    Yields:
+        Game result dictionaries in the order they were written.
+    """
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+def summarize_ndjson(path: Path, cache: LLMCache | None = None) -> dict[str, Any]:
+    """Compute summary statistics from an NDJSON results file.
+
+    Only the outcome and rounds of each game are kept in memory.
+
+    Args:
+        path: File written by run_benchmark, one result per line.
+        cache: Answer cache used for the run, as in summarize_results.
+
+    Returns:
+        Dictionary with summary statistics.
+    """
+    return summarize_results(ResultsBuffer.from_results(read_ndjson(path)), cache=cache)
+
+
+def summarize_results(
+    results: list[dict[str, Any]] | ResultsBuffer, cache: LLMCache | None = None
+) -> dict[str, Any]:
     """Compute summary statistics from game results.
 
     Args:
-        results: List of game result dictionaries.
+        results: List of game result dictionaries, or a ResultsBuffer
+            holding their outcome and rounds columns.
+        cache: Answer cache used for the run; if given, its hit and miss
+            counts are included in the summary.
 
     Returns:
         Dictionary with summary statistics.
     """
+    if not isinstance(results, ResultsBuffer):
+        results = ResultsBuffer.from_results(results)
     total = len(results)
-    wins = sum(1 for r in results if r["outcome"] == "win")
-    rounds_to_win = [r["rounds"] for r in results if r["outcome"] == "win"]
+    wins = results.count(Outcome.WIN)
+    rounds_to_win = results.rounds_for(Outcome.WIN)
+    has_wins = rounds_to_win.size > 0
 
-    return {
+    summary: dict[str, Any] = {
         "total_games": total,
         "wins": wins,
         "win_rate": wins / total if total > 0 else 0,
-        "non_convergence": sum(1 for r in results if r["outcome"] == "non_convergence"),
-        "repetitions": sum(1 for r in results if r["outcome"] == "repetition"),
-        "invalid_words": sum(1 for r in results if r["outcome"] == "invalid_word"),
-        "avg_rounds_to_win": sum(rounds_to_win) / len(rounds_to_win) if rounds_to_win else None,
-        "min_rounds_to_win": min(rounds_to_win) if rounds_to_win else None,
-        "max_rounds_to_win": max(rounds_to_win) if rounds_to_win else None,
+        "non_convergence": results.count(Outcome.NON_CONVERGENCE),
+        "repetitions": results.count(Outcome.REPETITION),
+        "invalid_words": results.count(Outcome.INVALID_WORD),
+        "avg_rounds_to_win": float(rounds_to_win.mean()) if has_wins else None,
+        "min_rounds_to_win": int(rounds_to_win.min()) if has_wins else None,
+        "max_rounds_to_win": int(rounds_to_win.max()) if has_wins else None,
     }
+    if cache is not None:
+        summary["cache_hits"] = cache.hits
+        summary["cache_misses"] = cache.misses
+    return summary
@@ -0,0 +1,146 @@
+"""Shared rate-limited scheduler for concurrent LLM calls.
+
+Follows the throttling approach of OpenAI's ``api_request_parallel_processor``:
+request and token capacity refill continuously at ``rpm / 60`` and ``tpm / 60``
+per second, and a call only starts once enough of both is available. A
+per-model semaphore additionally caps the number of requests in flight.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from litellm import acompletion  # pyright: ignore[reportUnknownVariableType]
+
+
+@dataclass(frozen=True)
+class ModelLimits:
+    """Rate limits applied to a single model.
+
+    Attributes:
+        max_concurrency: Maximum number of requests in flight at once.
+        rpm: Requests per minute, or None for no request limit.
+        tpm: Tokens per minute, or None for no token limit.
+    """
+
+    max_concurrency: int = 16
+    rpm: float | None = None
+    tpm: float | None = None
+
+
+class TokenBucket:
+    """Proactive request/token throttle with continuous refill.
+
+    Both buckets start full and refill linearly over time, so bursts up to
+    one minute's worth of capacity are allowed before callers start waiting.
+    """
+
+    def __init__(self, rpm: float | None = None, tpm: float | None = None) -> None:
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = rpm if rpm is not None else 0.0
+        self._tokens = tpm if tpm is not None else 0.0
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last
+        self._last = now
+        if self.rpm is not None:
+            self._requests = min(self.rpm, self._requests + self.rpm / 60 * elapsed)
+        if self.tpm is not None:
+            self._tokens = min(self.tpm, self._tokens + self.tpm / 60 * elapsed)
+
+    def _wait_time(self, tokens: float) -> float:
+        """Seconds until both buckets hold enough capacity (0 if ready now)."""
+        wait = 0.0
+        if self.rpm is not None and self._requests < 1:
+            wait = max(wait, (1 - self._requests) * 60 / self.rpm)
+        if self.tpm is not None:
+            # A single call larger than the whole bucket can never fit; let it
+            # through once the bucket is full rather than waiting forever.
+            needed = min(tokens, self.tpm)
+            if self._tokens < needed:
+                wait = max(wait, (needed - self._tokens) * 60 / self.tpm)
+        return wait
+
+    async def acquire(self, tokens: float = 0) -> None:
+        """Wait until one request and ``tokens`` tokens are available, then take them.
+
+        Args:
+            tokens: Estimated tokens the request will consume.
+        """
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = self._wait_time(tokens)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            if self.rpm is not None:
+                self._requests -= 1
+            if self.tpm is not None:
+                self._tokens -= min(tokens, self.tpm)
+
+
+def estimate_tokens(messages: list[dict[str, Any]], max_tokens: int = 0) -> int:
+    """Roughly estimate the tokens a chat request will consume.
+
+    Uses the common ~4 characters per token heuristic for the prompt plus the
+    completion budget, which is enough for proactive throttling.
+
+    Args:
+        messages: Chat messages to be sent.
+        max_tokens: Completion token budget for the request.
+
+    Returns:
+        Estimated total token count.
+    """
+    chars = sum(len(str(m.get("content", ""))) for m in messages)
+    return chars // 4 + max_tokens
+
+
+@dataclass
+class RateLimitedLLM:
+    """Shared scheduler that throttles ``litellm.acompletion`` calls per model.
+
+    A single instance can be shared by every player in every game so that all
+    games across all model pairs run concurrently while staying under each
+    provider's rate limits.
+
+    Attributes:
+        default_limits: Limits used for models without an explicit entry.
+        limits: Per-model overrides keyed by LiteLLM model identifier.
+    """
+
+    default_limits: ModelLimits = field(default_factory=ModelLimits)
+    limits: dict[str, ModelLimits] = field(default_factory=lambda: {})
+    _models: dict[str, tuple[asyncio.Semaphore, TokenBucket]] = field(
+        default_factory=lambda: {}, init=False, repr=False
+    )
+
+    def _get(self, model: str) -> tuple[asyncio.Semaphore, TokenBucket]:
+        if model not in self._models:
+            limits = self.limits.get(model, self.default_limits)
+            self._models[model] = (
+                asyncio.Semaphore(limits.max_concurrency),
+                TokenBucket(rpm=limits.rpm, tpm=limits.tpm),
+            )
+        return self._models[model]
+
+    async def acompletion(self, **kwargs: Any) -> Any:
+        """Call ``litellm.acompletion`` once rate limits and concurrency allow.
+
+        Args:
+            **kwargs: Arguments forwarded to ``litellm.acompletion``; must
+                include ``model`` and ``messages``.
+
+        Returns:
+            The LiteLLM response.
+        """
+        sem, bucket = self._get(kwargs["model"])
+        await bucket.acquire(estimate_tokens(kwargs["messages"], kwargs.get("max_tokens", 0)))
+        async with sem:
+            return await acompletion(**kwargs)  # pyright: ignore[reportUnknownVariableType]
@@ -0,0 +1,98 @@
+"""Shared HTTP connection pool for litellm calls.
+
+litellm only reads ``litellm.aclient_session`` on its OpenAI-family paths
+(OpenAI and OpenAI-compatible providers); other providers, such as Anthropic,
+use litellm's own cached clients, so these helpers do not affect them.
+"""
+
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+import httpx
+import litellm
+
+
+def _pooled_client(
+    max_connections: int, max_keepalive_connections: int, timeout: float
+) -> httpx.AsyncClient:
+    """Create a keep-alive HTTP/2 client with the given pool limits."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        ),
+        timeout=httpx.Timeout(timeout),
+    )
+
+
+@asynccontextmanager
+async def shared_http_client(
+    max_connections: int = 200,
+    max_keepalive_connections: int = 100,
+    timeout: float = 60.0,
+) -> AsyncGenerator[httpx.AsyncClient]:
+    """Route litellm's OpenAI-family async HTTP traffic through one pooled client.
+
+    Keeping connections alive across calls avoids a TCP + TLS handshake per
+    request to OpenAI and OpenAI-compatible providers. The previous
+    ``litellm.aclient_session`` is restored on exit.
+
+    Args:
+        max_connections: Maximum number of open connections.
+        max_keepalive_connections: Idle connections kept open for reuse.
+        timeout: Request timeout in seconds.
+
+    Yields:
+        The shared client.
+    """
+    client = _pooled_client(max_connections, max_keepalive_connections, timeout)
+    previous = litellm.aclient_session
+    litellm.aclient_session = client
+    try:
+        yield client
+    finally:
+        litellm.aclient_session = previous
+        await client.aclose()
+
+
+# Client opened by ensure_shared_http_client, shared by every block using it
+_ensured_client: httpx.AsyncClient | None = None
+_ensured_previous: object = None
+_ensured_users = 0
+
+
+@asynccontextmanager
+async def ensure_shared_http_client() -> AsyncGenerator[httpx.AsyncClient]:
+    """Reuse the installed litellm client, or open a pooled one for this block.
+
+    Lets library entry points such as run_benchmark get connection reuse
+    without overriding a client the caller has already installed. A client
+    opened here is shared by overlapping blocks and only closed, with the
+    previous ``litellm.aclient_session`` restored, when the last one exits.
+
+    Yields:
+        The client litellm uses inside the block.
+    """
+    global _ensured_client, _ensured_previous, _ensured_users
+
+    current = litellm.aclient_session
+    if _ensured_client is None or current is not _ensured_client:
+        if isinstance(current, httpx.AsyncClient) and not current.is_closed:
+            yield current
+            return
+        _ensured_client = _pooled_client(200, 100, 60.0)
+        _ensured_previous = current
+        litellm.aclient_session = _ensured_client
+
+    client = _ensured_client
+    _ensured_users += 1
+    try:
+        yield client
+    finally:
+        _ensured_users -= 1
+        if _ensured_users == 0:
+            litellm.aclient_session = _ensured_previous
+            _ensured_client = None
+            _ensured_previous = None
+            await client.aclose()
@@ -8,9 +8,15 @@ Factorial design support: generate triplets of words that create
 controlled pair combinations for rigorous benchmarking.
 """
 
+import bisect
+import math
 import random
+from collections.abc import Mapping, Sequence
 from functools import lru_cache
-from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
+import numpy.typing as npt
 
 
 # Common nouns suitable for word association games (ORIGINAL - may be too easy)
@@ -248,13 +254,27 @@ DIVERSE_WORDS: tuple[str, ...] = (
     "distance", "angle", "curve", "line", "point", "circle", "square", "triangle",
 )
 
+# Companion sets for O(1) membership checks; the tuples are kept for index-based sampling
+COMMON_NOUNS_SET: frozenset[str] = frozenset(COMMON_NOUNS)
+DIVERSE_WORDS_SET: frozenset[str] = frozenset(DIVERSE_WORDS)
+
+
+@lru_cache(maxsize=4)
+def _distinct_words(word_list: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the words of a word list in order, without repeated entries.
+
+    The curated lists repeat a few words across categories, so sampling
+    positions of the raw tuple could return the same word twice.
+    """
+    return tuple(dict.fromkeys(word_list))
+
 
 def load_dictionary_words() -> tuple[str, ...]:
     """Load diverse word list for challenging benchmarks.
 
     Returns a curated list of ~1000 common English words spanning
     many categories, designed to create challenging but fair
-    word association pairs.
+    word association pairs. Use DIVERSE_WORDS_SET for membership checks.
 
     Returns:
         Tuple of diverse common English words.
@@ -265,9 +285,9 @@ def load_dictionary_words() -> tuple[str, ...]:
 # Word frequency weights (Zipf-like distribution)
 # Higher tier = more common. Used for weighted sampling.
 # Tiers: 5=very common, 4=common, 3=moderate, 2=less common, 1=uncommon
-WORD_FREQUENCY_TIERS: dict[str, int] = {
+_TIER_WORDS: dict[int, list[str]] = {
     # Tier 5 - Very common (everyday words)
-    **{w: 5 for w in [
+    5: [
         "time", "life", "day", "man", "world", "way", "year", "work", "water",
         "money", "home", "hand", "school", "place", "room", "mother", "father",
         "child", "book", "word", "name", "food", "city", "car", "door", "house",
@@ -276,9 +296,9 @@ WORD_FREQUENCY_TIERS: dict[str, int] = {
         "bed", "window", "street", "road", "sky", "fire", "dog", "cat", "bird",
         "fish", "flower", "rain", "snow", "wind", "color", "light", "sound",
         "ball", "box", "cup", "key", "ring", "shoe", "hat", "coat", "shirt",
-    ]},
+    ],
     # Tier 4 - Common
-    **{w: 4 for w in [
+    4: [
         "truth", "power", "change", "death", "peace", "war", "dream", "hope",
         "fear", "anger", "joy", "memory", "idea", "history", "future", "past",
         "mountain", "river", "ocean", "forest", "island", "beach", "lake",
@@ -289,10 +309,10 @@ WORD_FREQUENCY_TIERS: dict[str, int] = {
         "moon", "storm", "song", "dance", "paint", "doctor", "teacher", "king",
         "queen", "soldier", "judge", "farm", "shop", "bank", "church", "castle",
         "knife", "gun", "sword", "battle", "army", "god", "angel", "devil",
-        "magic", "ghost", "king", "queen", "prince", "math", "science", "art",
-    ]},
+        "magic", "ghost", "prince", "math", "science", "art",
+    ],
     # Tier 3 - Moderate
-    **{w: 3 for w in [
+    3: [
         "freedom", "justice", "wisdom", "courage", "faith", "doubt", "pride",
         "shame", "guilt", "honor", "glory", "destiny", "fate", "soul", "spirit",
         "theory", "myth", "legend", "atom", "cell", "virus", "energy", "force",
@@ -322,9 +342,9 @@ WORD_FREQUENCY_TIERS: dict[str, int] = {
         "priest", "heaven", "hell", "miracle", "curse", "dragon", "wizard",
         "witch", "fairy", "vampire", "algebra", "geometry", "physics", "chemistry",
         "biology", "astronomy", "psychology", "philosophy", "economics", "poetry",
-    ]},
+    ],
     # Tier 2 - Less common
-    **{w: 2 for w in [
+    2: [
         "chaos", "order", "balance", "sorrow", "trust", "growth", "decay",
         "birth", "thought", "fact", "present", "gene", "bacteria", "protein",
         "enzyme", "acid", "carbon", "oxygen", "nitrogen", "hydrogen", "electron",
@@ -334,7 +354,7 @@ WORD_FREQUENCY_TIERS: dict[str, int] = {
         "radiation", "quantum", "plateau", "peninsula", "coast", "shore",
         "cliff", "cave", "prairie", "marsh", "stream", "pond", "bay", "gulf",
         "strait", "channel", "suburb", "district", "region", "continent",
-        "border", "frontier", "capital", "province", "arch", "staircase",
+        "border", "frontier", "capital", "province", "staircase",
         "corridor", "lobby", "attic", "balcony", "terrace", "courtyard",
         "axle", "motor", "gasoline", "diesel", "tram", "ferry", "submarine",
         "airplane", "parachute", "balloon", "glider", "pasta", "noodle",
@@ -382,9 +402,9 @@ WORD_FREQUENCY_TIERS: dict[str, int] = {
         "skillet", "wok", "kettle", "teapot", "coffeepot", "pitcher", "plate",
         "dish", "mug", "bottle", "jar", "chopstick", "ladle", "spatula",
         "whisk", "grater", "blender", "mixer", "toaster", "stove", "microwave",
-        "fridge", "forehead", "cheek", "chin", "jaw", "neck", "palm", "thumb",
+        "fridge", "forehead", "cheek", "chin", "jaw", "neck", "thumb",
         "chest", "spine", "hip", "waist", "belly", "navel", "rib", "thigh",
-        "calf", "heel", "toe", "eyebrow", "eyelash", "pupil", "iris", "retina",
+        "calf", "heel", "toe", "eyebrow", "eyelash", "pupil", "retina",
         "cornea", "earlobe", "eardrum", "nostril", "lip", "tongue", "gum",
         "larynx", "kidney", "stomach", "intestine", "bladder", "tendon",
         "ligament", "skull", "pelvis", "femur", "tibia", "vertebra", "pore",
@@ -397,8 +417,28 @@ WORD_FREQUENCY_TIERS: dict[str, int] = {
         "statistics", "geology", "ecology", "botany", "zoology", "anatomy",
         "sociology", "anthropology", "geography", "politics", "ethics",
         "logic", "rhetoric", "grammar", "literature", "drama", "fiction",
-    ]},
+    ],
+}
+
+
+def _tiers_by_word(tier_words: dict[int, list[str]]) -> dict[str, int]:
+    """Map each word to its tier, keeping the highest if listed more than once."""
+    tiers: dict[str, int] = {}
+    for tier, words in tier_words.items():
+        for word in words:
+            tiers[word] = max(tier, tiers.get(word, 0))
+    return tiers
+
+
+# Read-only, so the weights and tier arrays derived from it below cannot go stale
+WORD_FREQUENCY_TIERS: Mapping[str, int] = MappingProxyType(_tiers_by_word(_TIER_WORDS))
+
+
+# Sampling weight per tiered word, computed once: tier t -> 2**t
+_WEIGHT_BY_WORD: dict[str, float] = {
+    word: float(1 << tier) for word, tier in WORD_FREQUENCY_TIERS.items()
 }
+_DEFAULT_WEIGHT = float(1 << 1)
 
 
 def get_word_frequency_weight(word: str) -> float:
@@ -414,26 +454,82 @@ def get_word_frequency_weight(word: str) -> float:
     Returns:
         Float weight for use in weighted sampling.
     """
-    tier = WORD_FREQUENCY_TIERS.get(word, 1)
     # Exponential weighting: tier 5 is 32x more likely than tier 1
-    return 2 ** tier
+    return _WEIGHT_BY_WORD.get(word, _DEFAULT_WEIGHT)
+
+
+def _tiers_of(words: Sequence[str]) -> npt.NDArray[np.int8]:
+    """Return the frequency tier of each word, in order, at one byte per word."""
+    return np.fromiter(
+        (WORD_FREQUENCY_TIERS.get(w, 1) for w in words), dtype=np.int8, count=len(words)
+    )
+
+
+@lru_cache(maxsize=4)
+def _tiers_for(word_list: tuple[str, ...]) -> npt.NDArray[np.int8]:
+    """Return the frequency tier of every word in a word list, in order.
+
+    Word lists are module-level constants, so this is computed once per list.
+    """
+    return _tiers_of(word_list)
+
 
+def get_word_frequency_weights(words: Sequence[str]) -> npt.NDArray[np.float64]:
+    """Get the frequency weight of every word in a sequence.
 
-def get_seed_words(use_dictionary: bool = False) -> tuple[str, str]:
+    Equivalent to applying get_word_frequency_weight to each word, but
+    gathers all tiers in one pass and converts them to weights in bulk.
+
+    Args:
+        words: Words to weigh. Tuples are cached, so passing a module-level
+            word list repeatedly is cheap.
+
+    Returns:
+        Float array of weights aligned with ``words``.
+    """
+    tiers = _tiers_for(words) if isinstance(words, tuple) else _tiers_of(words)
+    return np.exp2(tiers, dtype=np.float64)
+
+
+@lru_cache(maxsize=4)
+def _cumulative_weights_for(word_list: tuple[str, ...]) -> list[float]:
+    """Return the running total of sampling weights over a word list."""
+    return np.cumsum(get_word_frequency_weights(word_list)).tolist()
+
+
+def get_seed_words(use_dictionary: bool = False, weighted: bool = False) -> tuple[str, str]:
     """Get two random different seed words for a game.
 
     Args:
         use_dictionary: If True, use full dictionary (~30k words).
                        If False, use common nouns (~250 words).
+        weighted: If True, pick words in proportion to their frequency
+            weight, as _weighted_sample does.
 
     Returns:
         Tuple of two different words.
     """
     word_list = load_dictionary_words() if use_dictionary else COMMON_NOUNS
+    if weighted:
+        # Binary search a precomputed cumulative table; redraw on the rare collision.
+        # Words listed twice would otherwise carry double weight.
+        word_list = _distinct_words(word_list)
+        cumulative = _cumulative_weights_for(word_list)
+        total = cumulative[-1]
+        while True:
+            word1 = word_list[bisect.bisect_right(cumulative, random.random() * total)]
+            word2 = word_list[bisect.bisect_right(cumulative, random.random() * total)]
+            if word1 != word2:
+                return (word1, word2)
+
     words = random.sample(word_list, 2)
     return (words[0], words[1])
 
 
+# Samples at most 1/8 of the list are cheaper by rejection than by Gumbel-top-k
+_REJECTION_SAMPLE_RATIO = 8
+
+
 def _weighted_sample(
     word_list: tuple[str, ...],
     n: int,
@@ -441,45 +537,44 @@ def _weighted_sample(
 ) -> list[str]:
     """Sample n unique words with frequency weighting.
 
-    Higher-frequency words are more likely to be selected.
+    Higher-frequency words are more likely to be selected. Small samples
+    draw with replacement from the cached cumulative weights and skip words
+    already taken, which rarely needs more than a few extra draws. Larger
+    samples use the Gumbel-top-k trick: perturbing each log-weight with
+    Gumbel noise and taking the n largest keys, in descending order. Both
+    match n sequential weighted draws without replacement.
 
     Args:
-        word_list: Tuple of words to sample from.
+        word_list: Tuple of words to sample from; repeated entries count once.
         n: Number of words to sample.
         rng: Random number generator instance.
 
     Returns:
         List of n unique sampled words.
     """
-    weights = [get_word_frequency_weight(w) for w in word_list]
-    total_weight = sum(weights)
-    probs = [w / total_weight for w in weights]
-
-    # Sample without replacement using weighted probabilities
-    available = list(range(len(word_list)))
-    available_probs = probs.copy()
-    selected = []
-
-    for _ in range(n):
-        # Normalize remaining probabilities
-        prob_sum = sum(available_probs)
-        if prob_sum == 0:
-            break
-        normalized = [p / prob_sum for p in available_probs]
-
-        # Select one index
-        r = rng.random()
-        cumulative = 0
-        for i, (idx, prob) in enumerate(zip(available, normalized)):
-            cumulative += prob
-            if r <= cumulative:
-                selected.append(word_list[idx])
-                # Remove selected item
-                available.pop(i)
-                available_probs.pop(i)
-                break
-
-    return selected
+    if n <= 0:
+        return []
+    # Weigh each word once, even if the list repeats it
+    word_list = _distinct_words(word_list)
+    if n * _REJECTION_SAMPLE_RATIO <= len(word_list):
+        cumulative = _cumulative_weights_for(word_list)
+        sampled: dict[str, None] = {}
+        while len(sampled) < n:
+            for word in rng.choices(word_list, cum_weights=cumulative, k=n - len(sampled)):
+                sampled[word] = None
+        return list(sampled)[:n]
+    # Seed NumPy from rng so results stay reproducible for a given seed
+    np_rng = np.random.default_rng(rng.getrandbits(64))
+    # Weights are 2**tier, so their logs are tier * ln(2)
+    log_weights = _tiers_for(word_list) * math.log(2)
+    keys = log_weights + np_rng.gumbel(size=len(word_list))
+    top = np.argpartition(-keys, n - 1)[:n]
+    top = top[np.argsort(-keys[top])]
+    return [word_list[i] for i in top]
+
+
+# Positions paired within each triplet (a, b, c): (a, b), (a, c), (b, c)
+_TRIPLET_PAIRS = ((0, 1), (0, 2), (1, 2))
 
 
 def generate_factorial_pairs(
@@ -513,35 +608,26 @@ def generate_factorial_pairs(
         [('apple', 'guitar'), ('apple', 'theory'), ('guitar', 'theory'),
          ('bench', 'music'), ('bench', 'planet'), ('music', 'planet')]
     """
-    rng = random.Random(seed)
-
-    word_list = load_dictionary_words() if use_dictionary else COMMON_NOUNS
+    words = _distinct_words(load_dictionary_words() if use_dictionary else COMMON_NOUNS)
 
     # Sample enough unique words for all triplets
     num_words_needed = num_triplets * 3
-    if num_words_needed > len(word_list):
-        raise ValueError(
-            f"Need {num_words_needed} unique words but only have {len(word_list)}"
-        )
+    if num_words_needed > len(words):
+        raise ValueError(f"Need {num_words_needed} unique words but only have {len(words)}")
 
     if weighted:
-        sampled_words = _weighted_sample(word_list, num_words_needed, rng)
+        sampled_words = _weighted_sample(words, num_words_needed, random.Random(seed))
+    elif seed is None:
+        # Unseeded: the shared module generator avoids building a new Random
+        sampled_words = random.sample(words, num_words_needed)
     else:
-        sampled_words = rng.sample(list(word_list), num_words_needed)
+        sampled_words = random.Random(seed).sample(words, num_words_needed)
 
-    pairs = []
-    for i in range(num_triplets):
-        # Get triplet
-        a = sampled_words[i * 3]
-        b = sampled_words[i * 3 + 1]
-        c = sampled_words[i * 3 + 2]
-
-        # Generate 3 pairs from triplet
-        pairs.append((a, b))
-        pairs.append((a, c))
-        pairs.append((b, c))
-
-    return pairs
+    return [
+        (sampled_words[base + i], sampled_words[base + j])
+        for base in range(0, num_words_needed, 3)
+        for i, j in _TRIPLET_PAIRS
+    ]
 
 
 def generate_random_pairs(
@@ -561,23 +647,18 @@ def generate_random_pairs(
     Returns:
         List of (word1, word2) pairs, all words unique.
     """
-    rng = random.Random(seed)
-
-    word_list = load_dictionary_words() if use_dictionary else COMMON_NOUNS
+    words = _distinct_words(load_dictionary_words() if use_dictionary else COMMON_NOUNS)
 
     num_words_needed = num_pairs * 2
-    if num_words_needed > len(word_list):
-        raise ValueError(
-            f"Need {num_words_needed} unique words but only have {len(word_list)}"
-        )
+    if num_words_needed > len(words):
+        raise ValueError(f"Need {num_words_needed} unique words but only have {len(words)}")
 
     if weighted:
-        sampled_words = _weighted_sample(word_list, num_words_needed, rng)
+        sampled_words = _weighted_sample(words, num_words_needed, random.Random(seed))
+    elif seed is None:
+        # Unseeded: the shared module generator avoids building a new Random
+        sampled_words = random.sample(words, num_words_needed)
     else:
-        sampled_words = rng.sample(list(word_list), num_words_needed)
-
-    pairs = []
-    for i in range(num_pairs):
-        pairs.append((sampled_words[i * 2], sampled_words[i * 2 + 1]))
+        sampled_words = random.Random(seed).sample(words, num_words_needed)
 
-    return pairs
+    return list(zip(sampled_words[::2], sampled_words[1::2], strict=True))
@@ -0,0 +1,63 @@
+"""Tests for the on-disk LLM answer cache."""
+
+from pathlib import Path
+
+import pytest
+
+from convergence.cache import LLMCache, cache_from_env
+
+
+class TestLLMCache:
+    """Tests for LLMCache."""
+
+    def test_miss_returns_none(self, tmp_path: Path) -> None:
+        """Unknown keys should miss."""
+        cache = LLMCache(tmp_path / "cache.sqlite")
+        assert cache.get("missing") is None
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Stored words should be returned for the same key."""
+        cache = LLMCache(tmp_path / "cache.sqlite")
+        cache.set("k", "fruit")
+        assert cache.get("k") == "fruit"
+
+    def test_counts_hits_and_misses(self, tmp_path: Path) -> None:
+        """Lookups should be tallied as hits or misses."""
+        cache = LLMCache(tmp_path / "cache.sqlite")
+        cache.get("k")
+        cache.set("k", "fruit")
+        cache.get("k")
+        cache.get("k")
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        """Entries should survive reopening the cache file."""
+        path = tmp_path / "cache.sqlite"
+        cache = LLMCache(path)
+        cache.set("k", "fruit")
+        cache.close()
+        assert LLMCache(path).get("k") == "fruit"
+
+    def test_key_depends_on_all_inputs(self) -> None:
+        """Changing model, temperature or prompt should change the key."""
+        base = LLMCache.key("m", 1.0, "prompt")
+        assert base == LLMCache.key("m", 1.0, "prompt")
+        assert base != LLMCache.key("other", 1.0, "prompt")
+        assert base != LLMCache.key("m", 0.0, "prompt")
+        assert base != LLMCache.key("m", 1.0, "other")
+
+
+class TestCacheFromEnv:
+    """Tests for cache_from_env."""
+
+    def test_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """No cache should be opened without the env var."""
+        monkeypatch.delenv("CONVERGENCE_LLM_CACHE", raising=False)
+        assert cache_from_env() is None
+
+    def test_enabled_by_env_var(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """CONVERGENCE_LLM_CACHE=1 should open the default cache."""
+        monkeypatch.setenv("CONVERGENCE_LLM_CACHE", "1")
+        monkeypatch.chdir(tmp_path)
+        assert isinstance(cache_from_env(), LLMCache)
+        assert (tmp_path / "data" / "llm_cache.sqlite").exists()
@@ -0,0 +1,38 @@
+"""Tests for event loop selection."""
+
+import asyncio
+import builtins
+from typing import Any
+
+import pytest
+
+from convergence.eventloop import fast_loop_factory, run
+
+
+class TestFastLoopFactory:
+    """Tests for fast_loop_factory."""
+
+    def test_falls_back_to_default_loop(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without uvloop or winloop installed, the default loop should be used."""
+        real_import = builtins.__import__
+
+        def fake_import(name: str, *args: Any, **kwargs: Any) -> Any:
+            if name in ("uvloop", "winloop"):
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", fake_import)
+        assert fast_loop_factory() is None
+
+
+class TestRun:
+    """Tests for run."""
+
+    def test_returns_coroutine_result(self) -> None:
+        """run should drive the coroutine to completion and return its value."""
+
+        async def main() -> int:
+            await asyncio.sleep(0)
+            return 42
+
+        assert run(main()) == 42
@@ -1,6 +1,10 @@
 """Tests for core game logic."""
 
 
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from convergence.game import Game, GameResult, GameState, Outcome
 
 
@@ -33,6 +37,13 @@ class TestGameState:
         assert state.is_finished is True
         assert state.converged_word == "fruit"
 
+    def test_finished_flag_for_constructed_state(self) -> None:
+        """finished should be derived for states built without add_round."""
+        state = GameState(player1_words=("apple", "fruit"), player2_words=("banana", "fruit"))
+        assert state.finished is True
+        assert state.is_finished is True
+        assert state.converged_word == "fruit"
+
     def test_all_words_property(self) -> None:
         """all_words should return all words used by both players."""
         state = GameState()
@@ -61,6 +72,20 @@ class TestGameState:
         assert "dog" in state.all_words
         assert "pet" in state.all_words
 
+    def test_all_words_tracked_incrementally(self) -> None:
+        """all_words carried forward by add_round should match a fresh computation."""
+        state = GameState(seed_word1="cat", seed_word2="dog")
+        state = state.add_round("Pet ", "animal")
+        state = state.add_round("fur", "paw")
+        fresh = GameState(
+            player1_words=state.player1_words,
+            player2_words=state.player2_words,
+            seed_word1="cat",
+            seed_word2="dog",
+        )
+        assert state.all_words == fresh.all_words
+        assert state.all_words == {"cat", "dog", "pet", "animal", "fur", "paw"}
+
 
 class TestGameResult:
     """Tests for GameResult class."""
@@ -100,6 +125,19 @@ class TestGameResult:
         assert result.outcome == Outcome.NON_CONVERGENCE
         assert result.converged_word is None
 
+    def test_result_is_immutable(self) -> None:
+        """A finished game's result should not be modifiable."""
+        result = GameResult(
+            outcome=Outcome.WIN,
+            rounds=1,
+            converged_word="fruit",
+            state=GameState().add_round("fruit", "fruit"),
+            player1_model="model1",
+            player2_model="model2",
+        )
+        with pytest.raises(FrozenInstanceError):
+            result.rounds = 2  # pyright: ignore[reportAttributeAccessIssue]
+
     def test_to_dict(self) -> None:
         """Result should serialize to dict for JSON export."""
         state = GameState()
@@ -1,11 +1,15 @@
 """Tests for LLM player abstraction."""
 
+import asyncio
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from convergence.cache import LLMCache
 from convergence.game import GameState
 from convergence.player import Player, extract_word
+from convergence.scheduler import RateLimitedLLM
 
 
 class TestExtractWord:
@@ -22,6 +26,7 @@ class TestExtractWord:
         assert extract_word("apple.") == "apple"
         assert extract_word("apple!") == "apple"
         assert extract_word('"apple"') == "apple"
+        assert extract_word("(apple)?") == "apple"
 
     def test_sentence_response(self) -> None:
         """Should extract first word from sentence."""
@@ -29,6 +34,13 @@ class TestExtractWord:
         # Note: extract_word takes first word, so "I think: apple" returns "i"
         # This is fine because LLMs are prompted to return just one word
         assert extract_word("fruit food") == "fruit"
+        assert extract_word("fruit\nfood") == "fruit"
+
+    def test_skips_punctuation_only_tokens(self) -> None:
+        """Quotes or dots before the word should not count as a word."""
+        assert extract_word('" apple"') == "apple"
+        assert extract_word("... Don't") == "dont"
+        assert extract_word('"?"') is None
 
     def test_empty_response(self) -> None:
         """Should handle empty responses."""
@@ -44,6 +56,13 @@ class TestPlayer:
         player = Player(model="gemini/gemini-2.5-flash")
         assert player.model == "gemini/gemini-2.5-flash"
 
+    def test_no_cache_by_default(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Players should not open their own cache, even with the env var set."""
+        monkeypatch.setenv("CONVERGENCE_LLM_CACHE", "1")
+        monkeypatch.chdir(tmp_path)
+        assert Player(model="gemini/gemini-2.5-flash").cache is None
+        assert not (tmp_path / "data").exists()
+
     def test_build_prompt_first_round_no_seeds(self) -> None:
         """First round prompt without seeds should ask for a starting word."""
         player = Player(model="gemini/gemini-2.5-flash")
@@ -104,3 +123,194 @@ class TestPlayer:
             # Check model was passed
             call_kwargs = mock_completion.call_args.kwargs
             assert call_kwargs["model"] == "gemini/gemini-2.5-flash"
+
+    @pytest.mark.asyncio
+    async def test_get_word_uses_scheduler(self) -> None:
+        """get_word should route calls through the scheduler when set."""
+        scheduler = RateLimitedLLM()
+        player = Player(model="gemini/gemini-2.5-flash", scheduler=scheduler)
+        state = GameState()
+
+        mock_response = AsyncMock()
+        mock_response.choices = [AsyncMock()]
+        mock_response.choices[0].message.content = "fruit"
+
+        with patch.object(
+            RateLimitedLLM, "acompletion", new=AsyncMock(return_value=mock_response)
+        ) as mock_completion:
+            word = await player.get_word(state, is_player1=True)
+
+        assert word == "fruit"
+        mock_completion.assert_called_once()
+
+    def test_build_prompt_history_cache_matches_fresh_build(self) -> None:
+        """Incrementally cached history should match a freshly built prompt."""
+        player = Player(model="gemini/gemini-2.5-flash")
+        state = GameState(seed_word1="cat", seed_word2="dog")
+        for word1, word2 in [("pet", "animal"), ("fur", "paw"), ("claw", "claw")]:
+            player.build_prompt(state, is_player1=True)
+            state = state.add_round(word1, word2)
+
+        fresh = Player(model="gemini/gemini-2.5-flash")
+        assert player.build_prompt(state, is_player1=True) == fresh.build_prompt(
+            state, is_player1=True
+        )
+        assert "Round 4:\nYou: claw\nOther: claw\n" in fresh.build_prompt(state, is_player1=True)
+
+    def test_build_prompt_cache_separates_games(self) -> None:
+        """Interleaved games sharing a player should not mix histories."""
+        player = Player(model="gemini/gemini-2.5-flash")
+        game_a = GameState(seed_word1="cat", seed_word2="dog").add_round("pet", "bone")
+        game_b = GameState(seed_word1="sun", seed_word2="moon").add_round("sky", "night")
+
+        prompt_a = player.build_prompt(game_a, is_player1=False)
+        prompt_b = player.build_prompt(game_b, is_player1=False)
+
+        assert "bone" in prompt_a and "night" not in prompt_a
+        assert "night" in prompt_b and "bone" not in prompt_b
+
+    @pytest.mark.asyncio
+    async def test_get_word_sets_reasoning_effort_for_gpt5(self) -> None:
+        """GPT-5 models should be called with minimal reasoning effort."""
+        player = Player(model="openai/gpt-5-mini")
+
+        mock_response = AsyncMock()
+        mock_response.choices = [AsyncMock()]
+        mock_response.choices[0].message.content = "fruit"
+
+        with patch("convergence.player.acompletion", return_value=mock_response) as mock_completion:
+            await player.get_word(GameState(), is_player1=True)
+
+        call_kwargs = mock_completion.call_args.kwargs
+        assert call_kwargs["reasoning_effort"] == "minimal"
+        assert call_kwargs["messages"][-1]["role"] == "user"
+
+    @pytest.mark.asyncio
+    async def test_get_word_uses_cache(self, tmp_path: Path) -> None:
+        """A cached answer should be returned without calling litellm."""
+        cache = LLMCache(tmp_path / "cache.sqlite")
+        player = Player(model="gemini/gemini-2.5-flash", temperature=0.0, cache=cache)
+        state = GameState()
+
+        mock_response = AsyncMock()
+        mock_response.choices = [AsyncMock()]
+        mock_response.choices[0].message.content = "fruit"
+
+        with patch("convergence.player.acompletion", return_value=mock_response) as mock_completion:
+            first = await player.get_word(state, is_player1=True)
+            second = await player.get_word(state, is_player1=True)
+
+        assert first == second == "fruit"
+        mock_completion.assert_called_once()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_get_word_skips_cache_when_sampling(self, tmp_path: Path) -> None:
+        """Nonzero temperatures should always call the model."""
+        cache = LLMCache(tmp_path / "cache.sqlite")
+        player = Player(model="gemini/gemini-2.5-flash", temperature=1.0, cache=cache)
+        state = GameState()
+
+        mock_response = AsyncMock()
+        mock_response.choices = [AsyncMock()]
+        mock_response.choices[0].message.content = "fruit"
+
+        with patch("convergence.player.acompletion", return_value=mock_response) as mock_completion:
+            await player.get_word(state, is_player1=True)
+            await player.get_word(state, is_player1=True)
+
+        assert mock_completion.call_count == 2
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_get_word_coalesces_identical_requests(self) -> None:
+        """Concurrent identical deterministic requests should share one API call."""
+        player = Player(model="gemini/gemini-2.5-flash", temperature=0.0, cache=None)
+        calls = 0
+
+        async def slow_completion(**_: object) -> AsyncMock:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            response = AsyncMock()
+            response.choices = [AsyncMock()]
+            response.choices[0].message.content = "fruit"
+            return response
+
+        state = GameState(seed_word1="apple", seed_word2="banana")
+        with patch("convergence.player.acompletion", new=slow_completion):
+            words = await asyncio.gather(*(player.get_word(state, True) for _ in range(3)))
+
+        assert words == ["fruit"] * 3
+        assert calls == 1
+        assert not player._inflight  # pyright: ignore[reportPrivateUsage]
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_orphaned_requests(self) -> None:
+        """Shared requests left behind by cancelled callers should be cancelled."""
+        player = Player(model="gemini/gemini-2.5-flash", temperature=0.0, cache=None)
+
+        async def hanging_completion(**_: object) -> None:
+            await asyncio.sleep(10)
+
+        state = GameState(seed_word1="apple", seed_word2="banana")
+        with patch("convergence.player.acompletion", new=hanging_completion):
+            caller = asyncio.create_task(player.get_word(state, True))
+            await asyncio.sleep(0)
+            caller.cancel()
+            await asyncio.gather(caller, return_exceptions=True)
+            assert player._inflight  # pyright: ignore[reportPrivateUsage]
+
+            await asyncio.wait_for(player.aclose(), timeout=1)
+
+        assert not player._inflight  # pyright: ignore[reportPrivateUsage]
+
+    @pytest.mark.asyncio
+    async def test_get_word_does_not_coalesce_when_sampling(self) -> None:
+        """Sampled requests should each get their own API call."""
+        player = Player(model="gemini/gemini-2.5-flash", temperature=1.0, cache=None)
+
+        mock_response = AsyncMock()
+        mock_response.choices = [AsyncMock()]
+        mock_response.choices[0].message.content = "fruit"
+
+        state = GameState(seed_word1="apple", seed_word2="banana")
+        with patch("convergence.player.acompletion", return_value=mock_response) as mock_completion:
+            await asyncio.gather(*(player.get_word(state, True) for _ in range(3)))
+
+        assert mock_completion.call_count == 3
+
+    def test_prompt_caching_marks_prefix_for_anthropic(self) -> None:
+        """Anthropic prompts should split into a cached prefix and the reply instruction."""
+        player = Player(model="anthropic/claude-haiku-4-5", prompt_caching=True)
+        state = GameState(seed_word1="cat", seed_word2="dog")
+        prompt = player.build_prompt(state, is_player1=True)
+
+        message = player._user_message(prompt)  # pyright: ignore[reportPrivateUsage]
+        blocks = message["content"]
+        assert isinstance(blocks, list)
+        assert blocks[-2]["cache_control"] == {"type": "ephemeral"}
+        assert "".join(block["text"] for block in blocks) == prompt
+
+    def test_prompt_caching_extends_previous_round_blocks(self) -> None:
+        """Each round's cached blocks should be a prefix of the next round's blocks."""
+        player = Player(model="anthropic/claude-haiku-4-5", prompt_caching=True)
+        state = GameState(seed_word1="cat", seed_word2="dog")
+        previous: list[str] | None = None
+        for words in [("pet", "bone"), ("fur", "tail"), ("paw", "paw")]:
+            prompt = player.build_prompt(state, is_player1=True)
+            blocks = player._user_message(prompt)["content"]  # pyright: ignore[reportPrivateUsage]
+            assert isinstance(blocks, list)
+            cached = [block["text"] for block in blocks[:-1]]
+            assert [i for i, b in enumerate(blocks) if "cache_control" in b] == [len(cached) - 1]
+            if previous is not None:
+                assert cached[: len(previous)] == previous
+                assert len(cached) == len(previous) + 1
+            previous = cached
+            state = state.add_round(*words)
+
+    def test_prompt_caching_ignored_for_other_providers(self) -> None:
+        """Non-Anthropic models should get the plain string prompt."""
+        player = Player(model="openai/gpt-5-mini", prompt_caching=True)
+        message = player._user_message("hello")  # pyright: ignore[reportPrivateUsage]
+        assert message == {"role": "user", "content": "hello"}
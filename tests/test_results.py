@@ -0,0 +1,39 @@
+"""Tests for the column-oriented results buffer."""
+
+from convergence.game import Outcome
+from convergence.results import ResultsBuffer
+
+
+class TestResultsBuffer:
+    """Tests for ResultsBuffer."""
+
+    def test_from_results_extracts_columns(self) -> None:
+        """Outcome and rounds should be stored column-wise in game order."""
+        buffer = ResultsBuffer.from_results(
+            [
+                {"outcome": "win", "rounds": 3, "state": {}},
+                {"outcome": "non_convergence", "rounds": 20},
+            ]
+        )
+        assert len(buffer) == 2
+        assert buffer.outcomes.tolist() == ["win", "non_convergence"]
+        assert buffer.rounds.tolist() == [3, 20]
+
+    def test_count_and_rounds_for(self) -> None:
+        """Counts and round selections should match the outcome column."""
+        buffer = ResultsBuffer.from_results(
+            [
+                {"outcome": "win", "rounds": 3},
+                {"outcome": "repetition", "rounds": 2},
+                {"outcome": "win", "rounds": 5},
+            ]
+        )
+        assert buffer.count(Outcome.WIN) == 2
+        assert buffer.count(Outcome.INVALID_WORD) == 0
+        assert buffer.rounds_for(Outcome.WIN).tolist() == [3, 5]
+
+    def test_empty(self) -> None:
+        """An empty buffer should have no games."""
+        buffer = ResultsBuffer.from_results([])
+        assert len(buffer) == 0
+        assert buffer.count(Outcome.WIN) == 0
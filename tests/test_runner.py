@@ -0,0 +1,312 @@
+"""Tests for the game runner."""
+
+import asyncio
+import io
+import json
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from convergence.cache import LLMCache
+from convergence.game import GameState, Outcome
+from convergence.player import Player
+from convergence.results import ResultsBuffer
+from convergence.runner import (
+    GameRunner,
+    model_slug,
+    ndjson_writer,
+    read_ndjson,
+    run_benchmark,
+    summarize_ndjson,
+    summarize_results,
+)
+
+
+async def converge_immediately(
+    self: Any, state: GameState, is_player1: bool, attempt: int = 0
+) -> str:
+    """Fake get_word where both players agree on the first round."""
+    return "bridge"
+
+
+class TestGameRunner:
+    """Tests for GameRunner."""
+
+    @pytest.mark.asyncio
+    async def test_invalid_first_word_cancels_slower_player(self) -> None:
+        """An invalid word should end the game without waiting for the other player."""
+        cancelled = False
+
+        async def fake_word(
+            self: Any, state: GameState, is_player1: bool, attempt: int = 0
+        ) -> str | None:
+            nonlocal cancelled
+            if is_player1:
+                return None
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            return "bridge"
+
+        runner = GameRunner(Player(model="m1", cache=None), Player(model="m2", cache=None))
+        with patch("convergence.runner.Player.get_word", new=fake_word):
+            result = await asyncio.wait_for(runner.play_game("cat", "dog"), timeout=1)
+
+        assert result.outcome == Outcome.INVALID_WORD
+        assert cancelled
+
+    @pytest.mark.asyncio
+    async def test_repeated_first_word_waits_for_other_player(self) -> None:
+        """A repeated word should not hide a slower player's invalid word."""
+
+        async def fake_word(
+            self: Any, state: GameState, is_player1: bool, attempt: int = 0
+        ) -> str | None:
+            if is_player1:
+                return "cat"
+            await asyncio.sleep(0.01)
+            return None
+
+        runner = GameRunner(
+            Player(model="m1", cache=None),
+            Player(model="m2", cache=None),
+            max_rounds=1,
+            max_retries_per_round=2,
+        )
+        with patch("convergence.runner.Player.get_word", new=fake_word):
+            result = await runner.play_game("cat", "dog")
+
+        assert result.outcome == Outcome.INVALID_WORD
+
+    @pytest.mark.asyncio
+    async def test_retry_is_not_answered_from_cache(self) -> None:
+        """A retried round should ask the model again rather than replay its cached word."""
+        calls = {"m1": 0, "m2": 0}
+
+        async def fake_completion(**kwargs: Any) -> MagicMock:
+            calls[kwargs["model"]] += 1
+            response = MagicMock()
+            repeat = kwargs["model"] == "m1" and calls["m1"] == 1
+            response.choices[0].message.content = "cat" if repeat else "bridge"
+            return response
+
+        cache = LLMCache(":memory:")
+        runner = GameRunner(
+            Player(model="m1", temperature=0, cache=cache),
+            Player(model="m2", temperature=0, cache=cache),
+        )
+        with patch("convergence.player.acompletion", new=fake_completion):
+            result = await runner.play_game("cat", "dog")
+
+        assert result.outcome == Outcome.WIN
+        assert calls == {"m1": 2, "m2": 2}
+
+    @pytest.mark.asyncio
+    async def test_verbose_lines_name_their_game(self) -> None:
+        """Progress lines should carry the game number so concurrent games can be told apart."""
+        runner = GameRunner(
+            Player(model="m1", cache=None), Player(model="m2", cache=None), verbose=True
+        )
+        output = io.StringIO()
+        with (
+            patch("convergence.runner.Player.get_word", new=converge_immediately),
+            redirect_stdout(output),
+        ):
+            await runner.play_game("cat", "dog", game_number=7)
+
+        lines = output.getvalue().splitlines()
+        assert lines
+        assert all(line.startswith("[Game 7] ") for line in lines)
+
+
+class TestRunBenchmark:
+    """Tests for run_benchmark."""
+
+    @pytest.mark.asyncio
+    async def test_on_result_called_per_game(self) -> None:
+        """on_result should receive every game result as it completes."""
+        streamed: list[dict[str, Any]] = []
+        with patch("convergence.runner.Player.get_word", new=converge_immediately):
+            results = await run_benchmark(
+                "model1",
+                "model2",
+                num_games=3,
+                seed_pairs=[("cat", "dog"), ("sun", "moon"), ("tea", "cup")],
+                on_result=streamed.append,
+            )
+
+        assert len(results) == 3
+        assert streamed == results
+        assert all(r["outcome"] == "win" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_writes_results_to_output_dir(self, tmp_path: Path) -> None:
+        """Results should be streamed as NDJSON when output_dir is given."""
+        with patch("convergence.runner.Player.get_word", new=converge_immediately):
+            results = await run_benchmark(
+                "openai/model1",
+                "model2",
+                num_games=2,
+                seed_pairs=[("cat", "dog"), ("sun", "moon")],
+                output_dir=tmp_path,
+            )
+
+        (output_path,) = tmp_path.glob("openai_model1_vs_model2_*.ndjson")
+        streamed = [json.loads(line) for line in output_path.read_text().splitlines()]
+        assert sorted(streamed, key=lambda r: r["game_number"]) == results
+        assert summarize_ndjson(output_path) == summarize_results(results)
+
+    @pytest.mark.asyncio
+    async def test_unseeded_games(self) -> None:
+        """use_seed_words=False should start games without seed words."""
+        with patch("convergence.runner.Player.get_word", new=converge_immediately):
+            results = await run_benchmark("model1", "model2", num_games=2, use_seed_words=False)
+
+        assert all("seed_word1" not in r for r in results)
+        assert all(r["outcome"] == "win" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_games_run_concurrently_in_order(self) -> None:
+        """Games should overlap in time but results stay in game order."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_word(self: Any, state: GameState, is_player1: bool, attempt: int = 0) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "bridge"
+
+        pairs = [("cat", "dog"), ("sun", "moon"), ("tea", "cup")]
+        with patch("convergence.runner.Player.get_word", new=slow_word):
+            results = await run_benchmark("model1", "model2", num_games=3, seed_pairs=pairs)
+
+        assert peak > 2  # more than one game's two players in flight
+        assert [r["game_number"] for r in results] == [1, 2, 3]
+        assert [r["seed_word1"] for r in results] == ["cat", "sun", "tea"]
+
+    @pytest.mark.asyncio
+    async def test_max_in_flight_limits_games_in_progress(self) -> None:
+        """No more than `max_in_flight` games should be in progress at once."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_word(self: Any, state: GameState, is_player1: bool, attempt: int = 0) -> str:
+            nonlocal in_flight, peak
+            if is_player1:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            if is_player1:
+                in_flight -= 1
+            return "bridge"
+
+        pairs = [("cat", "dog"), ("sun", "moon"), ("tea", "cup"), ("car", "road")]
+        with patch("convergence.runner.Player.get_word", new=slow_word):
+            results = await run_benchmark(
+                "model1", "model2", num_games=4, seed_pairs=pairs, max_in_flight=2
+            )
+
+        assert peak == 2
+        assert len(results) == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_game_cancels_remaining(self) -> None:
+        """A failing game should propagate and cancel games still running."""
+        started: list[str] = []
+
+        async def failing_word(
+            self: Any, state: GameState, is_player1: bool, attempt: int = 0
+        ) -> str:
+            if is_player1:
+                started.append(state.seed_word1 or "")
+            if state.seed_word1 == "cat":
+                raise RuntimeError("API down")
+            await asyncio.sleep(0.01)
+            return "bridge"
+
+        pairs = [("cat", "dog"), ("sun", "moon"), ("tea", "cup"), ("car", "road")]
+        with (
+            patch("convergence.runner.Player.get_word", new=failing_word),
+            pytest.raises(RuntimeError, match="API down"),
+        ):
+            await run_benchmark("model1", "model2", num_games=4, seed_pairs=pairs, max_in_flight=2)
+
+        assert "car" not in started
+
+
+class TestSummarizeResults:
+    """Tests for summarize_results."""
+
+    def test_counts_outcomes_and_win_rounds(self) -> None:
+        """Outcome tallies and round stats should cover every result."""
+        results = [
+            {"outcome": "win", "rounds": 2},
+            {"outcome": "win", "rounds": 4},
+            {"outcome": "non_convergence", "rounds": 20},
+            {"outcome": "repetition", "rounds": 3},
+            {"outcome": "invalid_word", "rounds": 1},
+        ]
+        summary = summarize_results(results)
+        assert summary["total_games"] == 5
+        assert summary["wins"] == 2
+        assert summary["win_rate"] == pytest.approx(0.4)
+        assert summary["non_convergence"] == summary["repetitions"] == summary["invalid_words"] == 1
+        assert summary["avg_rounds_to_win"] == 3
+        assert (summary["min_rounds_to_win"], summary["max_rounds_to_win"]) == (2, 4)
+
+    def test_accepts_results_buffer(self) -> None:
+        """A ResultsBuffer should summarize the same as the dictionaries."""
+        results = [{"outcome": "win", "rounds": 2}, {"outcome": "repetition", "rounds": 5}]
+        assert summarize_results(ResultsBuffer.from_results(results)) == summarize_results(results)
+
+    def test_empty_results(self) -> None:
+        """No games should give a zero win rate and no round stats."""
+        summary = summarize_results([])
+        assert summary["win_rate"] == 0
+        assert summary["avg_rounds_to_win"] is None
+
+    def test_includes_cache_counters(self, tmp_path: Path) -> None:
+        """Cache hit and miss counts should appear when a cache is given."""
+        cache = LLMCache(tmp_path / "cache.sqlite")
+        cache.get("missing")
+        results = [{"outcome": "win", "rounds": 2}]
+
+        assert "cache_hits" not in summarize_results(results)
+        summary = summarize_results(results, cache=cache)
+        assert (summary["cache_hits"], summary["cache_misses"]) == (0, 1)
+
+
+class TestNdjsonWriter:
+    """Tests for ndjson_writer."""
+
+    def test_round_trips_through_read_ndjson(self, tmp_path: Path) -> None:
+        """Each result should be flushed as its own line that read_ndjson reads back."""
+        results = [
+            {"game_number": 1, "outcome": "win"},
+            {"game_number": 2, "outcome": "max_rounds"},
+        ]
+        path = tmp_path / "results.ndjson"
+        with open(path, "wb") as stream:
+            write = ndjson_writer(stream)
+            write(results[0])
+            assert list(read_ndjson(path)) == results[:1]
+            write(results[1])
+
+        assert list(read_ndjson(path)) == results
+
+
+class TestModelSlug:
+    """Tests for model_slug."""
+
+    def test_replaces_path_separators(self) -> None:
+        """Slashes in provider-prefixed ids should become underscores."""
+        assert model_slug("anthropic/claude-haiku-4-5") == "anthropic_claude-haiku-4-5"
+        assert model_slug("gpt-5-mini") == "gpt-5-mini"
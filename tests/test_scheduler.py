@@ -0,0 +1,95 @@
+"""Tests for the rate-limited LLM scheduler."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from convergence.scheduler import ModelLimits, RateLimitedLLM, TokenBucket, estimate_tokens
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket throttling."""
+
+    @pytest.mark.asyncio
+    async def test_unlimited_does_not_wait(self) -> None:
+        """A bucket without limits should never block."""
+        bucket = TokenBucket()
+        await asyncio.wait_for(bucket.acquire(10_000), timeout=0.1)
+
+    @pytest.mark.asyncio
+    async def test_consumes_request_capacity(self) -> None:
+        """Each acquire should use one request of capacity."""
+        bucket = TokenBucket(rpm=60)
+        await bucket.acquire()
+        assert bucket._requests == pytest.approx(59, abs=0.1)  # pyright: ignore[reportPrivateUsage]
+
+    @pytest.mark.asyncio
+    async def test_waits_when_exhausted(self) -> None:
+        """Acquire should sleep once request capacity runs out."""
+        bucket = TokenBucket(rpm=600)  # refills one request every 0.1s
+        bucket._requests = 0  # pyright: ignore[reportPrivateUsage]
+        with patch("convergence.scheduler.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            mock_sleep.side_effect = lambda _: setattr(bucket, "_requests", 1)
+            await bucket.acquire()
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] == pytest.approx(0.1, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_still_proceeds(self) -> None:
+        """A request larger than the token bucket should not deadlock."""
+        bucket = TokenBucket(tpm=100)
+        await asyncio.wait_for(bucket.acquire(1_000), timeout=0.1)
+
+
+class TestEstimateTokens:
+    """Tests for token estimation."""
+
+    def test_counts_prompt_and_completion(self) -> None:
+        """Estimate should include ~4 chars/token plus max_tokens."""
+        messages = [{"role": "user", "content": "a" * 40}]
+        assert estimate_tokens(messages, max_tokens=50) == 60
+
+
+class TestRateLimitedLLM:
+    """Tests for RateLimitedLLM."""
+
+    @pytest.mark.asyncio
+    async def test_forwards_to_litellm(self) -> None:
+        """acompletion should forward kwargs to litellm."""
+        scheduler = RateLimitedLLM()
+        messages = [{"role": "user", "content": "hi"}]
+        with patch("convergence.scheduler.acompletion", new=AsyncMock(return_value="ok")) as mock:
+            result = await scheduler.acompletion(model="m", messages=messages)
+        assert result == "ok"
+        mock.assert_called_once_with(model="m", messages=messages)
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency_per_model(self) -> None:
+        """No more than max_concurrency calls should be in flight per model."""
+        scheduler = RateLimitedLLM(default_limits=ModelLimits(max_concurrency=2))
+        in_flight = 0
+        peak = 0
+
+        async def fake_completion(**_: object) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "ok"
+
+        messages = [{"role": "user", "content": "hi"}]
+        with patch("convergence.scheduler.acompletion", new=fake_completion):
+            await asyncio.gather(
+                *(scheduler.acompletion(model="m", messages=messages) for _ in range(6))
+            )
+        assert peak == 2
+
+    def test_per_model_limits(self) -> None:
+        """Models with explicit limits should get their own settings."""
+        scheduler = RateLimitedLLM(limits={"fast": ModelLimits(rpm=1000)})
+        _, fast_bucket = scheduler._get("fast")  # pyright: ignore[reportPrivateUsage]
+        _, other_bucket = scheduler._get("other")  # pyright: ignore[reportPrivateUsage]
+        assert fast_bucket.rpm == 1000
+        assert other_bucket.rpm is None
@@ -0,0 +1,71 @@
+"""Tests for the shared HTTP client."""
+
+import asyncio
+
+import httpx
+import litellm
+import pytest
+
+from convergence.session import ensure_shared_http_client, shared_http_client
+
+
+class TestSharedHttpClient:
+    """Tests for shared_http_client."""
+
+    @pytest.mark.asyncio
+    async def test_installs_and_restores_client(self) -> None:
+        """litellm should use the pooled client only inside the context."""
+        previous = litellm.aclient_session
+        async with shared_http_client() as client:
+            assert isinstance(client, httpx.AsyncClient)
+            assert litellm.aclient_session is client
+        assert litellm.aclient_session is previous
+        assert client.is_closed
+
+
+class TestEnsureSharedHttpClient:
+    """Tests for ensure_shared_http_client."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_installed_client(self) -> None:
+        """An already-installed client should be kept open and reused."""
+        async with shared_http_client() as outer:
+            async with ensure_shared_http_client() as inner:
+                assert inner is outer
+            assert not outer.is_closed
+            assert litellm.aclient_session is outer
+
+    @pytest.mark.asyncio
+    async def test_opens_client_when_missing(self) -> None:
+        """Without an installed client, one should be opened for the block."""
+        previous = litellm.aclient_session
+        litellm.aclient_session = None
+        try:
+            async with ensure_shared_http_client() as client:
+                assert litellm.aclient_session is client
+            assert client.is_closed
+            assert litellm.aclient_session is None
+        finally:
+            litellm.aclient_session = previous
+
+    @pytest.mark.asyncio
+    async def test_overlapping_blocks_share_client_until_last_exits(self) -> None:
+        """A block that exits first should not close the client others still use."""
+        previous = litellm.aclient_session
+        litellm.aclient_session = None
+        seen: list[tuple[bool, bool]] = []
+
+        async def use(delay: float) -> httpx.AsyncClient:
+            async with ensure_shared_http_client() as client:
+                await asyncio.sleep(delay)
+                seen.append((client.is_closed, litellm.aclient_session is client))
+                return client
+
+        try:
+            short, long = await asyncio.gather(use(0.01), use(0.05))
+            assert short is long
+            assert seen == [(False, True), (False, True)]
+            assert long.is_closed
+            assert litellm.aclient_session is None
+        finally:
+            litellm.aclient_session = previous
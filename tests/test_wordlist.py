@@ -1,8 +1,26 @@
 """Tests for word list and seed word generation."""
 
 import random
+from collections import Counter
 
-from convergence.wordlist import COMMON_NOUNS, get_seed_words
+import numpy as np
+import pytest
+
+from convergence.wordlist import (
+    _TIER_WORDS,  # pyright: ignore[reportPrivateUsage]
+    COMMON_NOUNS,
+    COMMON_NOUNS_SET,
+    DIVERSE_WORDS,
+    DIVERSE_WORDS_SET,
+    WORD_FREQUENCY_TIERS,
+    _tiers_for,  # pyright: ignore[reportPrivateUsage]
+    _weighted_sample,  # pyright: ignore[reportPrivateUsage]
+    generate_factorial_pairs,
+    generate_random_pairs,
+    get_seed_words,
+    get_word_frequency_weight,
+    get_word_frequency_weights,
+)
 
 
 class TestWordList:
@@ -22,6 +40,11 @@ class TestWordList:
         for word in COMMON_NOUNS:
             assert " " not in word
 
+    def test_common_nouns_set_matches_tuple(self) -> None:
+        """The membership set should hold exactly the sampled words."""
+        assert set(COMMON_NOUNS) == COMMON_NOUNS_SET
+        assert set(DIVERSE_WORDS) == DIVERSE_WORDS_SET
+
 
 class TestGetSeedWords:
     """Tests for seed word generation."""
@@ -37,6 +60,46 @@ class TestGetSeedWords:
         assert word1 in COMMON_NOUNS
         assert word2 in COMMON_NOUNS
 
+    def test_matches_random_sample_for_seed(self) -> None:
+        """Seeded picks should match random.sample so earlier runs stay reproducible."""
+        random.seed(42)
+        expected = tuple(random.sample(COMMON_NOUNS, 2))
+        random.seed(42)
+        assert get_seed_words() == expected
+
+    def test_weighted_returns_two_different_words(self) -> None:
+        """Weighted picks should be distinct words from the list."""
+        random.seed(0)
+        for _ in range(200):
+            word1, word2 = get_seed_words(weighted=True)
+            assert word1 != word2
+            assert word1 in COMMON_NOUNS_SET and word2 in COMMON_NOUNS_SET
+
+    def test_weighted_prefers_common_words(self) -> None:
+        """Tier-5 words should be picked far more often than their share of the list."""
+        random.seed(0)
+        picks = [w for _ in range(2000) for w in get_seed_words(weighted=True)]
+
+        def tier5_share(words: list[str] | tuple[str, ...]) -> float:
+            return sum(get_word_frequency_weight(w) == 32 for w in words) / len(words)
+
+        assert tier5_share(picks) > 2 * tier5_share(COMMON_NOUNS)
+
+    def test_weighted_does_not_favor_repeated_words(self) -> None:
+        """A word listed twice should be picked no more often than its weight warrants."""
+        assert COMMON_NOUNS.count("glass") == 2
+        weight = get_word_frequency_weight("glass")
+        peers = [
+            w
+            for w in COMMON_NOUNS_SET
+            if COMMON_NOUNS.count(w) == 1 and get_word_frequency_weight(w) == weight
+        ]
+        random.seed(0)
+        counts = Counter(w for _ in range(20000) for w in get_seed_words(weighted=True))
+        peer_mean = sum(counts[w] for w in peers) / len(peers)
+
+        assert counts["glass"] < 1.5 * peer_mean
+
     def test_respects_random_seed(self) -> None:
         """Same random seed should give same words."""
         random.seed(42)
@@ -53,3 +116,114 @@ class TestGetSeedWords:
         words2 = get_seed_words()
         # With a large word list, collision is very unlikely
         assert words1 != words2
+
+
+class TestFrequencyWeights:
+    """Tests for word frequency weights."""
+
+    def test_each_word_listed_in_one_tier(self) -> None:
+        """Tier lists should not repeat a word, within or across tiers."""
+        listed = [w for words in _TIER_WORDS.values() for w in words]
+        assert len(listed) == len(set(listed)) == len(WORD_FREQUENCY_TIERS)
+
+    def test_tiers_are_read_only(self) -> None:
+        """The public tier mapping should not be modifiable."""
+        with pytest.raises(TypeError):
+            WORD_FREQUENCY_TIERS["time"] = 1  # pyright: ignore[reportIndexIssue]
+
+    def test_weight_by_tier(self) -> None:
+        """Weights should double with each tier, defaulting to tier 1."""
+        assert get_word_frequency_weight("time") == 32  # tier 5
+        assert get_word_frequency_weight("chaos") == 4  # tier 2
+        assert get_word_frequency_weight("notaword") == 2
+
+    def test_tiers_for_matches_per_word_weights(self) -> None:
+        """The cached tier array should line up with the word list."""
+        tiers = _tiers_for(COMMON_NOUNS)
+        assert tiers.dtype == np.int8
+        assert [2 ** int(t) for t in tiers] == [get_word_frequency_weight(w) for w in COMMON_NOUNS]
+        assert _tiers_for(COMMON_NOUNS) is tiers
+
+    def test_bulk_weights_match_per_word_weights(self) -> None:
+        """Bulk weights should equal per-word weights for tuples and lists."""
+        words = ["time", "chaos", "notaword"]
+        assert get_word_frequency_weights(words).tolist() == [32, 4, 2]
+        bulk = get_word_frequency_weights(COMMON_NOUNS)
+        assert bulk.dtype == np.float64
+        assert bulk.tolist() == [get_word_frequency_weight(w) for w in COMMON_NOUNS]
+
+
+class TestWeightedSample:
+    """Tests for frequency-weighted sampling."""
+
+    def test_returns_unique_words_from_list(self) -> None:
+        """Samples should be distinct positions of the word list."""
+        words = _weighted_sample(COMMON_NOUNS, 30, random.Random(0))
+        assert len(words) == 30
+        assert all(w in COMMON_NOUNS_SET for w in words)
+        assert len(set(words)) == 30
+
+    def test_reproducible_with_seed(self) -> None:
+        """The same seed should give the same sample."""
+        first = _weighted_sample(COMMON_NOUNS, 10, random.Random(42))
+        assert first == _weighted_sample(COMMON_NOUNS, 10, random.Random(42))
+
+    def test_never_repeats_a_listed_word(self) -> None:
+        """Small and large samples should not repeat a word listed more than once."""
+        word_list = COMMON_NOUNS + COMMON_NOUNS
+        for n in (10, len(COMMON_NOUNS_SET)):
+            words = _weighted_sample(word_list, n, random.Random(0))
+            assert len(set(words)) == len(words) == n
+
+    def test_whole_list(self) -> None:
+        """Sampling every word should return a permutation of the list."""
+        word_list = ("time", "chaos", "notaword")
+        assert sorted(_weighted_sample(word_list, 3, random.Random(1))) == sorted(word_list)
+
+    def test_prefers_common_words(self) -> None:
+        """A 32x-weighted word should be drawn first most of the time."""
+        rng = random.Random(0)
+        firsts = [_weighted_sample(("time", "notaword"), 1, rng)[0] for _ in range(2000)]
+        assert firsts.count("time") / len(firsts) > 0.9
+
+
+class TestPairGeneration:
+    """Tests for seed pair generation."""
+
+    def test_factorial_pairs_cover_each_triplet(self) -> None:
+        """Every triplet (a, b, c) should yield (a, b), (a, c), (b, c)."""
+        pairs = generate_factorial_pairs(4, seed=3)
+        assert len(pairs) == 12
+        for k in range(0, 12, 3):
+            (a, b), (a2, c), (b2, c2) = pairs[k : k + 3]
+            assert (a, b, c) == (a2, b2, c2)
+            assert len({a, b, c}) == 3
+
+    def test_rejects_more_words_than_distinct_entries(self) -> None:
+        """Validation should count distinct words, not tuple entries."""
+        max_pairs = len(COMMON_NOUNS) // 2
+        assert len(COMMON_NOUNS_SET) < max_pairs * 2
+        with pytest.raises(ValueError, match="unique words"):
+            generate_random_pairs(max_pairs, seed=0, use_dictionary=False)
+
+    def test_pairs_never_repeat_a_listed_word(self) -> None:
+        """Words listed twice in the tuple should still be sampled at most once."""
+        num_pairs = len(DIVERSE_WORDS_SET) // 2
+        for weighted in (False, True):
+            pairs = generate_random_pairs(num_pairs, seed=1, weighted=weighted)
+            words = [w for pair in pairs for w in pair]
+            assert len(set(words)) == len(words) == num_pairs * 2
+
+    def test_random_pairs_use_unique_words(self) -> None:
+        """Random pairs should not reuse any word."""
+        pairs = generate_random_pairs(10, seed=3, weighted=False)
+        words = [w for pair in pairs for w in pair]
+        assert len(pairs) == 10
+        assert len(set(words)) == 20
+
+    def test_unseeded_unweighted_uses_module_generator(self) -> None:
+        """Without a seed, unweighted pairs should follow the global random state."""
+        random.seed(5)
+        first = generate_factorial_pairs(2, weighted=False)
+        random.seed(5)
+        assert generate_factorial_pairs(2, weighted=False) == first